@@ -5,14 +5,21 @@ Provides encrypted backup and restore functionality for Vault secrets.
 """
 
 import os
-import json
+import sys
+import getpass
 import base64
+import itertools
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 from ..utils.logging import get_logger
-from ..security.key_manager import SecureKeyManager
+from ..utils import compression, fastjson
 from ..models.config import VaultRunnerConfig
-from ..vault.client import VaultClient
+from ..vault._client_cache import get_cached_vault_client
+
+if TYPE_CHECKING:
+    from ..vault.client import VaultClient
 
 logger = get_logger(__name__)
 
@@ -33,6 +40,9 @@ def register_backup_commands(cli_parser):
     backup_parser.add_argument(
         "--password", help="Password for backup encryption (prompt if not provided)"
     )
+    backup_parser.add_argument(
+        "--key-file", help="Backup key file from cron-setup, used instead of a password"
+    )
 
     # Restore command
     restore_parser = cli_parser.add_parser(
@@ -47,6 +57,9 @@ def register_backup_commands(cli_parser):
     restore_parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be restored without doing it"
     )
+    restore_parser.add_argument(
+        "--verbose", "-v", action="store_true", help="List each restored secret"
+    )
 
     # Cron setup command
     cron_parser = cli_parser.add_parser(
@@ -66,10 +79,16 @@ def register_backup_commands(cli_parser):
 class BackupRestoreCommand:
     """Backup and restore command handler."""
 
-    def __init__(self, config: VaultRunnerConfig):
+    # Concurrent Vault requests used when walking a namespace for backup
+    MAX_WORKERS = 16
+
+    def __init__(self, config: VaultRunnerConfig, vault_client: Optional["VaultClient"] = None):
+        # Imported here so registering the backup parser does not load the crypto stack
+        from ..security.key_manager import SecureKeyManager
+
         self.config = config
         self.key_manager = SecureKeyManager(config.vault_dir)
-        self.vault_client = VaultClient(config)
+        self.vault_client = vault_client or get_cached_vault_client(config)
 
     def execute(self, args):
         """Execute backup/restore command."""
@@ -91,21 +110,23 @@ class BackupRestoreCommand:
     def _create_backup(self, args) -> int:
         """Create encrypted backup of vault secrets."""
         try:
-            # Get password
+            # Get password unless a backup key file was given
+            key_file = getattr(args, "key_file", None)
             password = args.password
-            if not password:
-                import getpass
+            if not password and not key_file:
                 password = getpass.getpass("Enter password for backup encryption: ")
                 confirm = getpass.getpass("Confirm password: ")
                 if password != confirm:
                     print("❌ Passwords do not match!")
                     return 1
 
+            now = datetime.now()
+
             # Determine output file
             if args.output:
                 output_file = Path(args.output)
             else:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 output_file = Path(f".vault/backups/vault_backup_{timestamp}.enc")
 
             output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -118,24 +139,22 @@ class BackupRestoreCommand:
                 print(f"⚠️  No secrets found in namespace '{namespace}'")
                 return 1
 
-            # Create backup data
-            backup_data = {
-                "metadata": {
-                    "created_at": datetime.now().isoformat(),
-                    "namespace": namespace,
-                    "secret_count": len(secrets),
-                    "version": "1.0"
-                },
-                "secrets": secrets
+            # Create backup metadata
+            metadata = {
+                "created_at": now.isoformat(),
+                "namespace": namespace,
+                "secret_count": len(secrets),
+                "version": "2.0"
             }
 
-            # Encrypt backup
-            json_data = json.dumps(backup_data, indent=2)
-            encrypted_data = self.key_manager.encrypt_vault_key(json_data, password)
-
-            # Save encrypted backup
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(encrypted_data)
+            # Stream-encrypt the backup straight to disk
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                self.key_manager.encrypt_stream(
+                    self._iter_backup_records(metadata, secrets),
+                    f,
+                    password,
+                    key_file=Path(key_file) if key_file else None,
+                )
 
             print(f"✅ Backup created successfully!")
             print(f"📁 File: {output_file}")
@@ -160,41 +179,44 @@ class BackupRestoreCommand:
             # Get password
             password = args.password
             if not password:
-                import getpass
                 password = getpass.getpass("Enter password for backup decryption: ")
 
-            # Read encrypted backup
-            with open(backup_file, "r", encoding="utf-8") as f:
-                encrypted_data = f.read()
+            # Authenticate the whole file before any of it is trusted
+            self._verify_backup(backup_file, password)
 
-            # Decrypt backup
-            json_data = self.key_manager.decrypt_vault_key(encrypted_data, password)
-            backup_data = json.loads(json_data)
+            records = self._iter_backup(backup_file, password)
+            metadata = next(records)["metadata"]
 
             print(f"📦 Restoring backup from {backup_file}")
-            print(f"📅 Created: {backup_data['metadata']['created_at']}")
-            print(f"🔐 Secrets: {backup_data['metadata']['secret_count']}")
-            print(f"🏷️  Namespace: {backup_data['metadata']['namespace']}")
+            print(f"📅 Created: {metadata['created_at']}")
+            print(f"🔐 Secrets: {metadata['secret_count']}")
+            print(f"🏷️  Namespace: {metadata['namespace']}")
 
             if args.dry_run:
-                print("\n📋 Secrets that would be restored:")
-                for path, value in backup_data["secrets"].items():
-                    print(f"  • {path}")
+                lines = ["\n📋 Secrets that would be restored:"]
+                lines.extend(f"  • {record['path']}" for record in records)
+                print("\n".join(lines))
                 print("\n💡 Use --dry-run=false to actually restore")
                 return 0
 
-            # Restore secrets
+            # Restore secrets as they are decrypted on the second pass
             restored_count = 0
-            for path, value in backup_data["secrets"].items():
+            lines = []
+            verbose = getattr(args, "verbose", False)
+            for record in records:
+                path = record["path"]
                 try:
                     if not self.config.dry_run:
-                        self.vault_client.put_secret(path, value)
+                        self.vault_client.put_secret(path, record["value"])
                     restored_count += 1
-                    print(f"✅ Restored: {path}")
+                    logger.debug("Restored secret: %s", path)
+                    if verbose:
+                        lines.append(f"✅ Restored: {path}")
                 except Exception as e:
-                    print(f"❌ Failed to restore {path}: {e}")
+                    lines.append(f"❌ Failed to restore {path}: {e}")
 
-            print(f"\n✅ Restore completed! Restored {restored_count} secrets.")
+            lines.append(f"\n✅ Restore completed! Restored {restored_count} secrets.")
+            sys.stdout.write("\n".join(lines) + "\n")
             return 0
 
         except Exception as e:
@@ -202,13 +224,87 @@ class BackupRestoreCommand:
             print(f"❌ Failed to restore backup: {e}")
             return 1
 
+    def _iter_backup_records(
+        self, metadata: dict, secrets: List[Tuple[str, str]]
+    ) -> Iterator[bytes]:
+        """
+        Yield the backup as NDJSON: a metadata header, then one line per secret.
+
+        The header line stays uncompressed and names the codec used for the
+        secret lines that follow, so restore can pick the right decompressor.
+        """
+        codec, compressor = compression.compressor()
+        yield fastjson.dumps_bytes({"metadata": {**metadata, "compression": codec}}) + b"\n"
+        for path, value in secrets:
+            chunk = compressor.compress(fastjson.dumps_bytes({"path": path, "value": value}) + b"\n")
+            if chunk:
+                yield chunk
+        yield compressor.flush()
+
+    def _verify_backup(self, backup_file: Path, password: str) -> None:
+        """
+        Decrypt a streamed backup without keeping the plaintext.
+
+        The GCM tag is only checked at the end of the stream, so this pass
+        raises ValueError for a tampered or truncated file before restore
+        writes anything. Legacy backups are verified when they are decrypted.
+        """
+        magic = self.key_manager.STREAM_MAGIC
+
+        with open(backup_file, "rb") as f:
+            if f.read(len(magic)) != magic:
+                return
+            f.seek(0)
+            for _ in self.key_manager.decrypt_stream(f, password):
+                pass
+
+    def _iter_backup(self, backup_file: Path, password: str) -> Iterator[dict]:
+        """Yield backup records: the metadata header first, then one per secret."""
+        magic = self.key_manager.STREAM_MAGIC
+
+        with open(backup_file, "rb") as f:
+            if f.read(len(magic)) != magic:
+                # Legacy backups are a single base64 blob of indented JSON
+                f.seek(0)
+                json_data = self.key_manager.decrypt_vault_key(f.read(), password)
+                backup_data = fastjson.loads(json_data)
+                yield {"metadata": backup_data["metadata"]}
+                for path, value in backup_data["secrets"].items():
+                    yield {"path": path, "value": value}
+                return
+
+            f.seek(0)
+            chunks = self.key_manager.decrypt_stream(f, password)
+
+            # The metadata header line is never compressed
+            buffer = b""
+            for chunk in chunks:
+                buffer += chunk
+                if b"\n" in buffer:
+                    break
+            header, _, buffer = buffer.partition(b"\n")
+            metadata = fastjson.loads(header)["metadata"]
+            yield {"metadata": metadata}
+
+            decompress = compression.decompressor(metadata.get("compression"))
+            pending = decompress(buffer)
+            buffer = b""
+            for chunk in itertools.chain([pending], map(decompress, chunks)):
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    if line:
+                        yield fastjson.loads(line)
+
+            if buffer:
+                yield fastjson.loads(buffer)
+
     def _setup_cron(self, args) -> int:
         """Set up automated nightly backups."""
         try:
             # Get password
             password = args.password
             if not password:
-                import getpass
                 password = getpass.getpass("Enter password for automated backups: ")
                 confirm = getpass.getpass("Confirm password: ")
                 if password != confirm:
@@ -217,19 +313,22 @@ class BackupRestoreCommand:
 
             backup_dir = args.backup_dir or ".vault/backups"
             schedule = args.schedule or "0 2 * * *"
+            cwd = Path.cwd()
+
+            # Store the derived backup key so the script never carries the password
+            key_file = self.key_manager.export_backup_key(password)
 
             # Create backup script
             script_content = f"""#!/bin/bash
 # VaultRunner Automated Backup Script
 # Generated on {datetime.now().isoformat()}
 
-export PYTHONPATH={Path.cwd()}/src
-cd {Path.cwd()}
+cd {cwd}
 
 # Run backup
-/home/tipsykat/dev/core/vaultrunner/.venv/bin/python src/vaultrunner/main.py backup \\
+{sys.executable} -m vaultrunner.main backup \\
     --output {backup_dir}/vault_backup_$(date +%Y%m%d_%H%M%S).enc \\
-    --password {password!r} \\
+    --key-file {key_file} \\
     --namespace shared
 
 echo "Backup completed at $(date)"
@@ -252,6 +351,7 @@ echo "Backup completed at $(date)"
             print("\n📋 Cron job details:")
             print(f"   Schedule: {schedule}")
             print(f"   Script: {script_path}")
+            print(f"   Key file: {key_file} (decrypts these backups; keep it private)")
             print(f"   Backup dir: {backup_dir}")
             print("\n✅ Automated backup setup complete!")
 
@@ -262,30 +362,48 @@ echo "Backup completed at $(date)"
             print(f"❌ Failed to setup automated backup: {e}")
             return 1
 
-    def _get_all_secrets(self, namespace: str) -> dict:
-        """Get all secrets from a namespace recursively."""
-        secrets = {}
-
-        def _collect_secrets(path: str):
-            """Recursively collect secrets from a path."""
-            try:
-                items = self.vault_client.list_secrets(path)
-                if items:
-                    for item in items:
-                        item_path = f"{path}/{item}" if path else item
-                        # Check if this is a secret (has data) or a folder
-                        try:
-                            value = self.vault_client.get_secret(item_path)
-                            if value is not None:
-                                secrets[item_path] = value
-                            else:
-                                # It's a folder, recurse
-                                _collect_secrets(item_path)
-                        except:
-                            # If we can't get it as a secret, try as a folder
-                            _collect_secrets(item_path)
-            except Exception as e:
-                logger.debug("Failed to list path %s: %s", path, e)
-
-        _collect_secrets(namespace)
-        return secrets
\ No newline at end of file
+    def _get_all_secrets(self, namespace: str) -> List[Tuple[str, str]]:
+        """Get all secrets from a namespace recursively as (path, value) pairs."""
+        secrets = []
+
+        # Listings and secret reads are independent Vault round-trips, so they
+        # are fanned out over a thread pool; the future map records which leaf
+        # path a read belongs to (None marks a folder listing).
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            pending = {executor.submit(self._list_path, namespace): None}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    secret_path = pending.pop(future)
+                    if secret_path is not None:
+                        value = future.result()
+                        if value is not None:
+                            secrets.append((secret_path, value))
+                        continue
+
+                    folders, leaves = future.result()
+                    for folder in folders:
+                        pending[executor.submit(self._list_path, folder)] = None
+                    for leaf in leaves:
+                        pending[executor.submit(self.vault_client.get_secret, leaf)] = leaf
+
+        return secrets
+
+    def _list_path(self, path: str) -> Tuple[List[str], List[str]]:
+        """List a path and split its entries into folders and secrets."""
+        folders, leaves = [], []
+        try:
+            items = self.vault_client.list_secrets(path) or []
+        except (ValueError, RuntimeError, OSError) as e:
+            logger.debug("Failed to list path %s: %s", path, e)
+            return folders, leaves
+
+        for item in items:
+            item_path = f"{path}/{item}" if path else item
+            # Vault KV LIST marks folders with a trailing slash
+            if item.endswith("/"):
+                folders.append(item_path.rstrip("/"))
+            else:
+                leaves.append(item_path)
+
+        return folders, leaves
@@ -5,11 +5,14 @@ Handles bulk secret operations with namespace support.
 Simplified implementation for Docker/ENV users.
 """
 
-import json
-from typing import Dict, List, Optional, Any
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from ..models.config import VaultRunnerConfig
-from ..vault.client import VaultClient
 from ..utils.logging import get_logger
+from ..utils import fastjson
+
+if TYPE_CHECKING:
+    from ..vault.client import VaultClient
 
 logger = get_logger(__name__)
 
@@ -17,7 +20,10 @@ logger = get_logger(__name__)
 class BulkOperations:
     """Service for bulk secret operations."""
 
-    def __init__(self, config: VaultRunnerConfig, vault_client: VaultClient):
+    # Secrets buffered between readers and writers during copy_namespace
+    COPY_QUEUE_SIZE = 256
+
+    def __init__(self, config: VaultRunnerConfig, vault_client: "VaultClient"):
         self.config = config
         self.vault_client = vault_client
 
@@ -46,23 +52,24 @@ class BulkOperations:
             "namespace": target_namespace,
         }
 
-        for key, value in secrets.items():
-            try:
-                secret_path = f"{target_namespace}/{key}"
-                if namespace:
-                    secret_path = f"{namespace}/{key}"
+        prefix = target_namespace + "/"
+        secret_paths = {key: prefix + key for key in secrets}
 
-                if not self.config.dry_run:
-                    self.vault_client.put_secret(secret_path, value)
+        if self.config.dry_run:
+            written = dict.fromkeys(secret_paths.values(), True)
+        else:
+            written = self.vault_client.batch_put(
+                {secret_paths[key]: value for key, value in secrets.items()}
+            )
 
+        for key, secret_path in secret_paths.items():
+            if written[secret_path]:
                 result["success_count"] += 1
                 logger.debug("Set secret: %s", key)
-
-            except Exception as e:
+            else:
                 result["error_count"] += 1
-                error_msg = f"Failed to set {key}: {str(e)}"
-                result["errors"].append(error_msg)
-                logger.error("Failed to set secret %s: %s", key, str(e))
+                result["errors"].append(f"Failed to set {key}")
+                logger.error("Failed to set secret %s", key)
 
         return result
 
@@ -86,20 +93,17 @@ class BulkOperations:
             source_namespace,
         )
 
-        secrets = {}
-
-        for secret_name in secret_names:
-            try:
-                secret_path = f"{source_namespace}/{secret_name}"
-                secret_value = self.vault_client.get_secret(secret_path)
-
-                if secret_value:
-                    secrets[secret_name] = secret_value
-                else:
-                    logger.warning("Secret not found or empty: %s", secret_name)
+        prefix = source_namespace + "/"
+        secret_paths = {name: prefix + name for name in secret_names}
+        values = self.vault_client.batch_get(list(secret_paths.values()))
 
-            except Exception as e:
-                logger.error("Failed to get secret %s: %s", secret_name, str(e))
+        secrets = {}
+        for secret_name, secret_path in secret_paths.items():
+            secret_value = values[secret_path]
+            if secret_value:
+                secrets[secret_name] = secret_value
+            else:
+                logger.warning("Secret not found or empty: %s", secret_name)
 
         return secrets
 
@@ -156,12 +160,70 @@ class BulkOperations:
             "Copying secrets from '%s' to '%s'", source_namespace, target_namespace
         )
 
-        # Get all secrets from source namespace
         secret_names = self.list_secrets_in_namespace(source_namespace)
-        secrets = self.get_multiple_secrets(secret_names, source_namespace)
+        return asyncio.run(
+            self._copy_secrets_async(secret_names, source_namespace, target_namespace)
+        )
+
+    async def _copy_secrets_async(
+        self, secret_names: List[str], source_namespace: str, target_namespace: str
+    ) -> Dict[str, Any]:
+        """
+        Stream secrets from one namespace to another.
+
+        Readers feed a bounded queue that writers drain, so writes start as
+        soon as the first read completes and at most COPY_QUEUE_SIZE values
+        are buffered at once. Counters need no lock as everything runs on
+        one event loop.
+        """
+        result = {
+            "success_count": 0,
+            "error_count": 0,
+            "errors": [],
+            "namespace": target_namespace,
+        }
+
+        workers = self.vault_client.BATCH_CONCURRENCY
+        semaphore = asyncio.Semaphore(workers)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.COPY_QUEUE_SIZE)
+        pending_names = iter(secret_names)
+        source_prefix = source_namespace + "/"
+        target_prefix = target_namespace + "/"
+
+        async def _read() -> None:
+            for secret_name in pending_names:
+                value = await self.vault_client.get_secret_async(
+                    source_prefix + secret_name, semaphore
+                )
+                if value:
+                    await queue.put((secret_name, value))
+                else:
+                    logger.warning("Secret not found or empty: %s", secret_name)
+
+        async def _write() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                secret_name, value = item
+                written = self.config.dry_run or await self.vault_client.put_secret_async(
+                    target_prefix + secret_name, value, semaphore
+                )
+                if written:
+                    result["success_count"] += 1
+                    logger.debug("Set secret: %s", secret_name)
+                else:
+                    result["error_count"] += 1
+                    result["errors"].append(f"Failed to set {secret_name}")
+                    logger.error("Failed to set secret %s", secret_name)
 
-        # Set secrets in target namespace
-        return self.set_multiple_secrets(secrets, target_namespace)
+        async def _produce() -> None:
+            await asyncio.gather(*(_read() for _ in range(workers)))
+            for _ in range(workers):
+                await queue.put(None)
+
+        await asyncio.gather(_produce(), *(_write() for _ in range(workers)))
+        return result
 
     def delete_namespace(self, namespace: str, confirm: bool = False) -> Dict[str, Any]:
         """
@@ -191,10 +253,11 @@ class BulkOperations:
 
         # Get all secrets in namespace
         secret_names = self.list_secrets_in_namespace(namespace)
+        prefix = namespace + "/"
 
         for secret_name in secret_names:
             try:
-                vault_path = f"secret/{namespace}/{secret_name}"
+                vault_path = prefix + secret_name
 
                 if not self.config.dry_run:
                     self.vault_client.delete_secret(vault_path)
@@ -277,68 +340,94 @@ def register_bulk_commands(cli_parser):
     )
 
 
-def handle_bulk_command(args, config: VaultRunnerConfig, vault_client: VaultClient):
-    """Handle bulk operation command execution."""
-    bulk_ops = BulkOperations(config, vault_client)
-
-    if hasattr(args, "namespace_action"):
-        # Namespace commands
-        if args.namespace_action == "list":
-            namespaces = bulk_ops.list_namespaces()
-            print("Available namespaces:")
-            for namespace in namespaces:
-                marker = (
-                    " (current)"
-                    if namespace == config.get_effective_namespace()
-                    else ""
-                )
-                shared_marker = (
-                    " (shared)" if namespace == config.default_namespace else ""
-                )
-                print(f"  - {namespace}{marker}{shared_marker}")
-
-        elif args.namespace_action == "secrets":
-            secrets = bulk_ops.list_secrets_in_namespace(args.namespace)
-            namespace = args.namespace or config.get_effective_namespace()
-            print(f"Secrets in namespace '{namespace}':")
-            for secret in secrets:
-                print(f"  - {secret}")
-
-        elif args.namespace_action == "copy":
-            result = bulk_ops.copy_namespace(args.source, args.target)
-            print(
-                f"Copied {result['success_count']} secrets from '{args.source}' to '{args.target}'"
-            )
-            if result["error_count"] > 0:
-                print(f"Errors: {result['error_count']}")
+def _namespace_list(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """List all namespaces."""
+    namespaces = bulk_ops.list_namespaces()
+    current_namespace = config.get_effective_namespace()
+    lines = ["Available namespaces:"]
+    for namespace in namespaces:
+        marker = " (current)" if namespace == current_namespace else ""
+        shared_marker = " (shared)" if namespace == config.default_namespace else ""
+        lines.append(f"  - {namespace}{marker}{shared_marker}")
+    print("\n".join(lines))
+
+
+def _namespace_secrets(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """List secrets in a namespace."""
+    secrets = bulk_ops.list_secrets_in_namespace(args.namespace)
+    namespace = args.namespace or config.get_effective_namespace()
+    lines = [f"Secrets in namespace '{namespace}':"]
+    lines.extend(f"  - {secret}" for secret in secrets)
+    print("\n".join(lines))
+
+
+def _namespace_copy(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """Copy all secrets from one namespace to another."""
+    result = bulk_ops.copy_namespace(args.source, args.target)
+    print(
+        f"Copied {result['success_count']} secrets from '{args.source}' to '{args.target}'"
+    )
+    if result["error_count"] > 0:
+        print(f"Errors: {result['error_count']}")
 
-        elif args.namespace_action == "delete":
-            result = bulk_ops.delete_namespace(args.namespace, args.confirm)
-            print(
-                f"Deleted {result['success_count']} secrets from namespace '{args.namespace}'"
-            )
-            if result["error_count"] > 0:
-                print(f"Errors: {result['error_count']}")
-
-    elif hasattr(args, "secrets_json"):
-        # Bulk set command
-        if args.from_file:
-            with open(args.secrets_json, "r", encoding="utf-8") as f:
-                secrets_data = json.load(f)
-        else:
-            secrets_data = json.loads(args.secrets_json)
-
-        result = bulk_ops.set_multiple_secrets(secrets_data, args.namespace)
-        print(f"Set {result['success_count']} secrets")
-        if result["error_count"] > 0:
-            print(f"Errors: {result['error_count']}")
-
-    elif hasattr(args, "secret_names"):
-        # Bulk get command
-        secrets = bulk_ops.get_multiple_secrets(args.secret_names, args.namespace)
-
-        if args.format == "json":
-            print(json.dumps(secrets, indent=2))
-        elif args.format == "env":
-            for key, value in secrets.items():
-                print(f'{key}="{value}"')
+
+def _namespace_delete(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """Delete all secrets in a namespace."""
+    result = bulk_ops.delete_namespace(args.namespace, args.confirm)
+    print(
+        f"Deleted {result['success_count']} secrets from namespace '{args.namespace}'"
+    )
+    if result["error_count"] > 0:
+        print(f"Errors: {result['error_count']}")
+
+
+def _namespace_command(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """Dispatch a namespace subcommand."""
+    handler = _NAMESPACE_ACTIONS.get(getattr(args, "namespace_action", None))
+    if handler is not None:
+        handler(bulk_ops, args, config)
+
+
+def _bulk_set(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """Set multiple secrets from JSON."""
+    if args.from_file:
+        with open(args.secrets_json, "rb") as f:
+            secrets_data = fastjson.loads(f.read())
+    else:
+        secrets_data = fastjson.loads(args.secrets_json)
+
+    result = bulk_ops.set_multiple_secrets(secrets_data, args.namespace)
+    print(f"Set {result['success_count']} secrets")
+    if result["error_count"] > 0:
+        print(f"Errors: {result['error_count']}")
+
+
+def _bulk_get(bulk_ops: BulkOperations, args, config: VaultRunnerConfig) -> None:
+    """Get multiple secrets."""
+    secrets = bulk_ops.get_multiple_secrets(args.secret_names, args.namespace)
+
+    if args.format == "json":
+        print(fastjson.dumps(secrets, indent=True))
+    elif args.format == "env" and secrets:
+        print("\n".join(f'{key}="{value}"' for key, value in secrets.items()))
+
+
+_NAMESPACE_ACTIONS = {
+    "list": _namespace_list,
+    "secrets": _namespace_secrets,
+    "copy": _namespace_copy,
+    "delete": _namespace_delete,
+}
+
+_BULK_COMMANDS = {
+    "namespace": _namespace_command,
+    "bulk-set": _bulk_set,
+    "bulk-get": _bulk_get,
+}
+
+
+def handle_bulk_command(args, config: VaultRunnerConfig, vault_client: "VaultClient"):
+    """Handle bulk operation command execution."""
+    handler = _BULK_COMMANDS.get(args.command)
+    if handler is not None:
+        handler(BulkOperations(config, vault_client), args, config)
@@ -4,17 +4,22 @@ Deployment Command Module
 Handles deployment operations with namespace support for secure secret injection.
 """
 
+import sys
+import logging
+from collections import deque
+from functools import cached_property
 from argparse import ArgumentParser, Namespace
-from typing import Any
+from typing import Any, Deque, Dict, List, Optional
 
 from ..models.config import VaultRunnerConfig
+from ..utils.lazy_parser import command_invoked
 from ..utils.logging import get_logger
-from ..vault.client import VaultClient
+from ..vault._client_cache import get_cached_vault_client
 
 logger = get_logger(__name__)
 
 
-def register_deploy_parser(subparsers: Any) -> None:
+def register_deploy_parser(subparsers: Any, argv: Optional[List[str]] = None) -> None:
     """Register deploy subcommand parser."""
     parser = subparsers.add_parser(
         "deploy",
@@ -22,6 +27,13 @@ def register_deploy_parser(subparsers: Any) -> None:
         description="Deploy Docker Compose applications with automatic secret injection from Vault namespaces",
     )
 
+    # Arguments are only needed when deploy is the invoked command
+    if command_invoked("deploy", argv):
+        _build_deploy_parser(parser)
+
+
+def _build_deploy_parser(parser: ArgumentParser) -> None:
+    """Add deploy arguments."""
     parser.add_argument(
         "--namespace", "-n",
         help="Secret namespace to use for deployment (default: shared)"
@@ -41,6 +53,8 @@ def register_deploy_parser(subparsers: Any) -> None:
     )
     parser.add_argument(
         "--services",
+        type=_service_list,
+        default=[],
         help="Comma-separated list of specific services to deploy"
     )
     parser.add_argument(
@@ -62,15 +76,33 @@ def register_deploy_parser(subparsers: Any) -> None:
         action="store_true",
         help="Show deployment plan without executing"
     )
+    parser.add_argument(
+        "--capture-logs",
+        action="store_true",
+        help="Log the tail of docker compose output when deployment fails"
+    )
+
+
+def _service_list(value: str) -> List[str]:
+    """Split a comma-separated --services value into service names."""
+    return [service.strip() for service in value.split(",") if service.strip()]
 
 
 class DeployCommand:
     """Deploy command handler."""
 
+    # Output lines kept from docker compose when --capture-logs is used
+    LOG_TAIL_LINES = 1000
+
     def __init__(self, config: VaultRunnerConfig):
         """Initialize deploy command."""
         self.config = config
-        self.vault_client = VaultClient(config)
+        self.vault_client = get_cached_vault_client(config)
+
+    @cached_property
+    def _effective_namespace(self) -> str:
+        """Namespace from configuration, used when --namespace is not given."""
+        return self.config.get_effective_namespace()
 
     def execute(self, args: Namespace) -> int:
         """Execute deploy command."""
@@ -83,10 +115,7 @@ class DeployCommand:
     def _deploy(self, args: Namespace) -> int:
         """Deploy application with Vault integration."""
         # Get namespace
-        namespace = (
-            getattr(args, "namespace", None) or
-            self.config.get_effective_namespace()
-        )
+        namespace = getattr(args, "namespace", None) or self._effective_namespace
 
         logger.info("Deploying with namespace: %s", namespace)
 
@@ -95,17 +124,13 @@ class DeployCommand:
             self.config.vault_addr = args.vault_addr
 
         # Validate namespace exists and has secrets
-        secrets = self.vault_client.list_secrets()
+        secrets = self.vault_client.list_secrets(namespace)
         if not secrets:
             logger.warning("No secrets found in namespace: %s", namespace)
             logger.info("You can add secrets with: vaultrunner secrets add <path> <value> --namespace %s", namespace)
             return 1
 
-        # Check if compose file exists
-        import os
-        if not os.path.exists(args.compose_file):
-            logger.error("Compose file not found: %s", args.compose_file)
-            return 1
+        # A missing compose file is reported by docker compose itself
 
         # Dry run mode
         if args.dry_run:
@@ -116,28 +141,42 @@ class DeployCommand:
 
     def _dry_run(self, args: Namespace, namespace: str, secrets: list) -> int:
         """Show deployment plan without executing."""
-        logger.info("🔍 DRY RUN - Deployment Plan:")
-        logger.info("  📁 Compose file: %s", args.compose_file)
-        logger.info("  📦 Namespace: %s", namespace)
-        logger.info("  🔐 Secrets found: %d", len(secrets))
+        import os
+
+        # docker compose never runs on a dry run, so nothing else reports a missing file
+        try:
+            os.stat(args.compose_file)
+        except FileNotFoundError:
+            logger.error("Compose file not found: %s", args.compose_file)
+            return 1
+
+        if not logger.isEnabledFor(logging.INFO):
+            return 0
+
+        lines = [
+            "🔍 DRY RUN - Deployment Plan:",
+            f"  📁 Compose file: {args.compose_file}",
+            f"  📦 Namespace: {namespace}",
+            f"  🔐 Secrets found: {len(secrets)}",
+        ]
 
         if args.services:
-            logger.info("  🐳 Services: %s", args.services)
+            lines.append(f"  🐳 Services: {', '.join(args.services)}")
 
         if args.sidecar:
-            logger.info("  🔗 Sidecar: VaultRunner sidecar will be deployed")
+            lines.append("  🔗 Sidecar: VaultRunner sidecar will be deployed")
 
         if args.network:
-            logger.info("  🌐 Network: %s", args.network)
+            lines.append(f"  🌐 Network: {args.network}")
 
-        logger.info("\n📋 Secrets that will be injected:")
-        for secret in secrets[:10]:  # Show first 10
-            logger.info("  • %s", secret)
+        lines.append("\n📋 Secrets that will be injected:")
+        lines.extend(f"  • {secret}" for secret in secrets[:10])  # Show first 10
 
         if len(secrets) > 10:
-            logger.info("  ... and %d more", len(secrets) - 10)
+            lines.append(f"  ... and {len(secrets) - 10} more")
 
-        logger.info("\n✅ Dry run complete - no changes made")
+        lines.append("\n✅ Dry run complete - no changes made")
+        logger.info("%s", "\n".join(lines))
         return 0
 
     def _perform_deployment(self, args: Namespace, namespace: str, secrets: list) -> int:
@@ -151,41 +190,37 @@ class DeployCommand:
         cmd = ["docker", "compose", "-f", args.compose_file]
 
         # Add specific services if provided
-        if args.services:
-            services = args.services.split(",")
-            cmd.extend(["up", "-d"] + services)
-        else:
-            cmd.extend(["up", "-d"])
+        cmd.extend(["up", "-d"])
+        cmd.extend(args.services)
 
         # Set environment variables for Vault access
-        env = os.environ.copy()
-        env.update({
+        env = {
+            **os.environ,
             "VAULT_ADDR": self.config.vault_addr,
             "VAULT_TOKEN": self.config.vault_token or "",
             "VAULTRUNNER_NAMESPACE": namespace,
-        })
+        }
 
         # Add environment file if provided
         if args.env_file:
-            if os.path.exists(args.env_file):
+            try:
+                os.close(os.open(args.env_file, os.O_RDONLY))
+            except FileNotFoundError:
+                logger.warning("Environment file not found: %s", args.env_file)
+            else:
                 cmd.extend(["--env-file", args.env_file])
                 logger.info("📄 Using environment file: %s", args.env_file)
-            else:
-                logger.warning("Environment file not found: %s", args.env_file)
 
         logger.info("🔧 Executing: %s", ' '.join(cmd))
 
         try:
-            result = subprocess.run(
-                cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                cwd=os.getcwd(),
-                check=False
-            )
-
-            if result.returncode == 0:
+            if getattr(args, "capture_logs", False):
+                returncode = self._run_with_log_tail(cmd, env)
+            else:
+                # Inherit stdio so docker progress streams straight to the terminal
+                returncode = subprocess.run(cmd, env=env, check=False).returncode
+
+            if returncode == 0:
                 logger.info("✅ Deployment successful!")
                 logger.info("🔍 Check logs: docker compose -f %s logs", args.compose_file)
                 logger.info("📊 Check status: docker compose -f %s ps", args.compose_file)
@@ -196,14 +231,41 @@ class DeployCommand:
                 return 0
             else:
                 logger.error("❌ Deployment failed!")
-                logger.error(f"STDOUT: {result.stdout}")
-                logger.error("STDERR: %s", result.stderr)
                 return 1
 
         except (subprocess.SubprocessError, OSError) as e:
             logger.error("Deployment execution failed: %s", e)
             return 1
 
+    def _run_with_log_tail(self, cmd: List[str], env: Dict[str, str]) -> int:
+        """
+        Run a command, echoing its output and keeping the last lines for the log.
+
+        Args:
+            cmd: Command to run
+            env: Environment for the command
+
+        Returns:
+            The command's exit code
+        """
+        import subprocess
+
+        tail: Deque[str] = deque(maxlen=self.LOG_TAIL_LINES)
+        with subprocess.Popen(
+            cmd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as process:
+            for line in process.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
+
+        if process.returncode != 0:
+            logger.error("Last %d lines of output:\n%s", len(tail), "".join(tail))
+        return process.returncode
+
     def _verify_secret_injection(self, args: Namespace, namespace: str) -> None:
         """Verify that secrets are being injected properly."""
         logger.info("\n🔍 Secret Injection Verification:")
@@ -1,26 +1,97 @@
 """Docker integration commands for VaultRunner."""
 
 import os
-import yaml
-import subprocess
-from pathlib import Path
-from typing import Optional, Dict, Any
+import copy
+import itertools
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from ..utils.logging import get_logger
+from ..utils.lazy_parser import LazySubparsers
 
 logger = get_logger(__name__)
 
-
-def register_docker_parser(subparsers):
+# Compose file names, in lookup order within a directory
+_COMPOSE_NAMES = (
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    "compose.yml",
+    "compose.yaml",
+)
+
+# Parsed compose files keyed by path, valid while mtime and size match
+_COMPOSE_CACHE: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+_COMPOSE_CACHE_SIZE = 64
+
+# VaultRunner sidecar service added to compose files; depends_on is set per file
+_SIDECAR_TEMPLATE: Dict[str, Any] = {
+    "image": "vaultrunner:latest",
+    "container_name": "vaultrunner-sidecar",
+    "environment": {
+        "VAULT_ADDR": "http://vault:8200",
+        "VAULT_TOKEN": "${VAULT_TOKEN:-}",
+        "VAULTRUNNER_ENV": "docker",
+    },
+    "volumes": [
+        ".:/workspace:rw",
+        "/var/run/docker.sock:/var/run/docker.sock:ro",
+    ],
+    "working_dir": "/workspace",
+    "profiles": ["vaultrunner"],
+}
+
+
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """Import yaml with the libyaml-backed safe loader and dumper when available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+def _load_compose(compose_file: str) -> Any:
+    """Parse a compose file, reusing the cached result while the file is unchanged."""
+    yaml, loader, _ = _yaml_codec()
+
+    st = os.stat(compose_file)
+    cached = _COMPOSE_CACHE.get(compose_file)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _COMPOSE_CACHE.move_to_end(compose_file)
+        # Callers may modify the result, so never hand out the cached object
+        return copy.deepcopy(cached[2])
+
+    with open(compose_file, "r") as f:
+        compose_data = yaml.load(f, Loader=loader)
+
+    _COMPOSE_CACHE[compose_file] = (st.st_mtime, st.st_size, compose_data)
+    if len(_COMPOSE_CACHE) > _COMPOSE_CACHE_SIZE:
+        _COMPOSE_CACHE.popitem(last=False)
+    return copy.deepcopy(compose_data)
+
+
+def register_docker_parser(subparsers, argv: Optional[List[str]] = None):
     """Register docker command parser."""
     parser = subparsers.add_parser("docker", help="Docker integration")
-    subparsers_docker = parser.add_subparsers(
-        dest="docker_command", help="Docker commands"
+    subparsers_docker = LazySubparsers(
+        parser.add_subparsers(dest="docker_command", help="Docker commands"),
+        "docker",
+        argv,
     )
 
-    # Start command
-    start_parser = subparsers_docker.add_parser(
-        "start", help="Start VaultRunner with network integration"
+    # Only the invoked subcommand parser is built
+    subparsers_docker.add_parser(
+        "start", _build_start_parser, help="Start VaultRunner with network integration"
+    )
+    subparsers_docker.add_parser("stop", help="Stop VaultRunner")
+    subparsers_docker.add_parser("status", help="Show VaultRunner status")
+    subparsers_docker.add_parser(
+        "network", _build_network_parser, help="Network management"
     )
+    subparsers_docker.materialize()
+
+
+def _build_start_parser(start_parser) -> None:
+    """Add docker start arguments."""
     start_parser.add_argument(
         "--project-dir", help="Project directory to scan for docker-compose files"
     )
@@ -31,16 +102,9 @@ def register_docker_parser(subparsers):
         help="Add VaultRunner as sidecar to existing compose",
     )
 
-    # Stop command
-    stop_parser = subparsers_docker.add_parser("stop", help="Stop VaultRunner")
-
-    # Status command
-    status_parser = subparsers_docker.add_parser(
-        "status", help="Show VaultRunner status"
-    )
 
-    # Network command
-    network_parser = subparsers_docker.add_parser("network", help="Network management")
+def _build_network_parser(network_parser) -> None:
+    """Add docker network arguments."""
     network_parser.add_argument(
         "action", choices=["detect", "join", "list"], help="Network action"
     )
@@ -52,6 +116,25 @@ class DockerCommand:
 
     def __init__(self, config):
         self.config = config
+        # Docker SDK client, created on first use; False means use the CLI
+        self._client = None
+
+    def _docker_client(self):
+        """Get a Docker SDK client, or None when the docker CLI must be used."""
+        if self._client is None:
+            try:
+                import docker
+                from docker.errors import DockerException
+            except ImportError:
+                self._client = False
+                return None
+
+            try:
+                self._client = docker.from_env()
+            except DockerException as e:
+                logger.debug("Docker SDK unavailable, using docker CLI: %s", e)
+                self._client = False
+        return self._client or None
 
     def execute(self, args):
         """Execute docker command."""
@@ -101,12 +184,9 @@ class DockerCommand:
 
     def _detect_project_network(self, project_dir: str) -> Optional[str]:
         """Detect Docker network from existing docker-compose files."""
-        compose_files = self._find_compose_files(project_dir)
-
-        for compose_file in compose_files:
+        for compose_file in self._iter_compose_files(project_dir):
             try:
-                with open(compose_file, "r") as f:
-                    compose_data = yaml.safe_load(f)
+                compose_data = _load_compose(compose_file)
 
                 networks = compose_data.get("networks", {})
                 if networks:
@@ -121,61 +201,49 @@ class DockerCommand:
 
         return None
 
-    def _find_compose_files(self, project_dir: str) -> list:
-        """Find docker-compose files in project directory."""
-        compose_files = []
+    def _iter_compose_files(self, project_dir: str) -> Iterator[str]:
+        """Yield docker-compose files from the project directory upwards."""
+        from pathlib import Path
+
         project_path = Path(project_dir)
 
         # Check current directory and parent directories
-        for path in [project_path] + list(project_path.parents):
-            for filename in [
-                "docker-compose.yml",
-                "docker-compose.yaml",
-                "compose.yml",
-                "compose.yaml",
-            ]:
+        for path in itertools.chain((project_path,), project_path.parents):
+            for filename in _COMPOSE_NAMES:
                 compose_file = path / filename
                 if compose_file.exists():
-                    compose_files.append(str(compose_file))
-
-        return compose_files
+                    yield str(compose_file)
+                    # Variants in the same directory are alternatives
+                    break
 
     def _add_sidecar_to_compose(self, project_dir: str) -> None:
         """Add VaultRunner as a sidecar service to existing docker-compose file."""
-        compose_files = self._find_compose_files(project_dir)
+        yaml, _, dumper = _yaml_codec()
 
-        if not compose_files:
+        compose_file = next(self._iter_compose_files(project_dir), None)
+
+        if not compose_file:
             logger.warning("No docker-compose file found to modify")
             return
 
-        compose_file = compose_files[0]  # Use the first one found
         logger.info(f"Adding VaultRunner sidecar to {compose_file}")
 
         try:
-            with open(compose_file, "r") as f:
-                compose_data = yaml.safe_load(f) or {}
+            compose_data = _load_compose(compose_file) or {}
 
             # Ensure services section exists
-            if "services" not in compose_data:
-                compose_data["services"] = {}
-
-            # Add VaultRunner service
-            compose_data["services"]["vaultrunner"] = {
-                "image": "vaultrunner:latest",
-                "container_name": "vaultrunner-sidecar",
-                "environment": {
-                    "VAULT_ADDR": "http://vault:8200",
-                    "VAULT_TOKEN": "${VAULT_TOKEN:-}",
-                    "VAULTRUNNER_ENV": "docker",
-                },
-                "volumes": [
-                    ".:/workspace:rw",
-                    "/var/run/docker.sock:/var/run/docker.sock:ro",
-                ],
-                "working_dir": "/workspace",
-                "depends_on": ["vault"] if "vault" in compose_data["services"] else [],
-                "profiles": ["vaultrunner"],
-            }
+            services = compose_data.setdefault("services", {})
+
+            # Build VaultRunner service
+            service = copy.deepcopy(_SIDECAR_TEMPLATE)
+            service["depends_on"] = ["vault"] if "vault" in services else []
+
+            # Skip rewriting the file when the sidecar is already up to date
+            if services.get("vaultrunner") == service and "networks" in compose_data:
+                logger.info("VaultRunner sidecar already present in docker-compose file")
+                return
+
+            services["vaultrunner"] = service
 
             # Ensure networks section exists and add vaultrunner network
             if "networks" not in compose_data:
@@ -183,7 +251,13 @@ class DockerCommand:
 
             # Write back the modified compose file
             with open(compose_file, "w") as f:
-                yaml.dump(compose_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    compose_data,
+                    f,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
             logger.info("VaultRunner sidecar added to docker-compose file")
 
@@ -192,7 +266,32 @@ class DockerCommand:
 
     def _start_vault_container(self, network_name: Optional[str] = None) -> int:
         """Start VaultRunner container with network configuration."""
+        import subprocess
+
+        vault_addr = self.config.vault_addr or "http://vault:8200"
+        vault_token = self.config.vault_token or ""
+        workspace = os.getcwd()
+
         try:
+            client = self._docker_client()
+            if client is not None:
+                client.containers.run(
+                    "vaultrunner:latest",
+                    name="vaultrunner",
+                    detach=True,
+                    network=network_name,
+                    environment={"VAULT_ADDR": vault_addr, "VAULT_TOKEN": vault_token},
+                    volumes={
+                        workspace: {"bind": "/workspace", "mode": "rw"},
+                        "/var/run/docker.sock": {
+                            "bind": "/var/run/docker.sock",
+                            "mode": "ro",
+                        },
+                    },
+                )
+                logger.info("VaultRunner container started successfully")
+                return 0
+
             cmd = ["docker", "run", "-d"]
 
             if network_name:
@@ -203,11 +302,11 @@ class DockerCommand:
                     "--name",
                     "vaultrunner",
                     "--env",
-                    f'VAULT_ADDR={self.config.vault_addr or "http://vault:8200"}',
+                    f"VAULT_ADDR={vault_addr}",
                     "--env",
-                    f'VAULT_TOKEN={self.config.vault_token or ""}',
+                    f"VAULT_TOKEN={vault_token}",
                     "--volume",
-                    f"{os.getcwd()}:/workspace:rw",
+                    f"{workspace}:/workspace:rw",
                     "--volume",
                     "/var/run/docker.sock:/var/run/docker.sock:ro",
                     "vaultrunner:latest",
@@ -228,7 +327,15 @@ class DockerCommand:
 
     def _stop_vault(self, args) -> int:
         """Stop VaultRunner container."""
+        import subprocess
+
         try:
+            client = self._docker_client()
+            if client is not None:
+                client.containers.get("vaultrunner").stop()
+                logger.info("VaultRunner container stopped")
+                return 0
+
             result = subprocess.run(
                 ["docker", "stop", "vaultrunner"], capture_output=True, text=True
             )
@@ -244,7 +351,17 @@ class DockerCommand:
 
     def _show_status(self, args) -> int:
         """Show VaultRunner status."""
+        import subprocess
+
         try:
+            client = self._docker_client()
+            if client is not None:
+                if client.containers.list(filters={"name": "vaultrunner"}):
+                    print("VaultRunner container is running")
+                    return 0
+                print("VaultRunner container is not running")
+                return 1
+
             result = subprocess.run(
                 ["docker", "ps", "--filter", "name=vaultrunner"],
                 capture_output=True,
@@ -266,6 +383,8 @@ class DockerCommand:
 
     def _handle_network(self, args) -> int:
         """Handle network-related commands."""
+        import subprocess
+
         if args.action == "detect":
             project_dir = args.project_dir or os.getcwd()
             network = self._detect_project_network(project_dir)
@@ -282,6 +401,17 @@ class DockerCommand:
 
         elif args.action == "list":
             try:
+                client = self._docker_client()
+                if client is not None:
+                    lines = [f"{'NETWORK ID':<14}{'NAME':<30}{'DRIVER':<10}SCOPE"]
+                    lines.extend(
+                        f"{n.short_id:<14}{n.name:<30}"
+                        f"{n.attrs.get('Driver', ''):<10}{n.attrs.get('Scope', '')}"
+                        for n in client.networks.list()
+                    )
+                    print("\n".join(lines))
+                    return 0
+
                 result = subprocess.run(
                     ["docker", "network", "ls"], capture_output=True, text=True
                 )
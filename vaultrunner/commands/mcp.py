@@ -5,26 +5,363 @@ Provides MCP server functionality for VaultRunner, exposing tools for
 secret management, deployment automation, and migration workflows.
 """
 
-import json
+import os
 import sys
-from typing import Any, Dict, List, Optional
-
+import socket
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils import fastjson
 from ..utils.logging import get_logger
-from ..security.key_manager import SecureKeyManager
 from ..models.config import VaultRunnerConfig
 
 logger = get_logger(__name__)
 
 
+# AES-NI capability bit in OpenSSL's ia32cap vector (CPUID.1:ECX bit 25)
+_IA32CAP_AESNI_BIT = 57
+
+
+def _aesni_disabled_by_env() -> bool:
+    """Check whether the OPENSSL_ia32cap environment variable turns off AES-NI."""
+    value = os.environ.get("OPENSSL_ia32cap", "").split(":")[0].strip()
+    if not value:
+        return False
+
+    try:
+        if value.startswith("~"):
+            # "~mask" clears the given bits from the detected capabilities
+            return bool(int(value[1:], 0) >> _IA32CAP_AESNI_BIT & 1)
+        # A plain value replaces the detected capabilities
+        return not int(value, 0) >> _IA32CAP_AESNI_BIT & 1
+    except ValueError:
+        return False
+
+
+def _cpu_crypto_features() -> Optional[Dict[str, bool]]:
+    """
+    Detect CPU extensions used by OpenSSL for AES-GCM and SHA-256.
+
+    Returns:
+        Dict of extension name to availability, or None when detection is
+        not supported on this platform
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo", "r") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    if key.strip() in ("flags", "Features"):
+                        flags = set(value.split())
+                        break
+                else:
+                    return None
+        except OSError:
+            return None
+    elif sys.platform == "darwin":
+        import platform
+        import subprocess
+
+        if platform.machine() == "arm64":
+            # Apple silicon always implements the ARMv8 crypto extensions
+            return {"AES": True, "SHA": True, "CLMUL": True}
+        result = subprocess.run(
+            ["sysctl", "-n", "machdep.cpu.features", "machdep.cpu.leaf7_features"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return None
+        flags = set(result.stdout.lower().split())
+    else:
+        return None
+
+    # x86 and ARM report the same extensions under different names
+    return {
+        "AES": "aes" in flags,
+        "SHA": "sha_ni" in flags or "sha" in flags or "sha2" in flags,
+        "CLMUL": "pclmulqdq" in flags or "pmull" in flags,
+    }
+
+
+def _build_tools() -> List[Dict[str, Any]]:
+    """Build the list of MCP tool definitions."""
+    tools = [
+        {
+            "name": "vault_secure_init",
+            "description": "Initialize secure vault with password protection",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "password": {"type": "string", "description": "Master password for vault"}
+                },
+                "required": ["password"]
+            }
+        },
+        {
+            "name": "vault_generate_ssl",
+            "description": "Generate SSL certificates for Vault",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "common_name": {"type": "string", "description": "Common name for certificate"}
+                }
+            }
+        },
+        {
+            "name": "vault_encrypt_key",
+            "description": "Encrypt a vault key with password protection",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "vault_key": {"type": "string", "description": "Vault key to encrypt"},
+                    "password": {"type": "string", "description": "Password for encryption"}
+                },
+                "required": ["vault_key", "password"]
+            }
+        },
+        {
+            "name": "vault_decrypt_key",
+            "description": "Decrypt a vault key",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "encrypted_key": {"type": "string", "description": "Encrypted key data"},
+                    "password": {"type": "string", "description": "Password for decryption"}
+                },
+                "required": ["encrypted_key", "password"]
+            }
+        },
+        {
+            "name": "vault_export_key",
+            "description": "Export encrypted vault key for backup",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "password": {"type": "string", "description": "Password to decrypt key"}
+                },
+                "required": ["password"]
+            }
+        },
+        {
+            "name": "batch_execute",
+            "description": "Execute several tool calls in one request",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "description": "Tool calls to execute",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "tool": {"type": "string", "description": "Tool name"},
+                                "arguments": {"type": "object", "description": "Tool arguments"}
+                            },
+                            "required": ["tool"]
+                        }
+                    },
+                    "maxConcurrent": {
+                        "type": "integer",
+                        "description": "Maximum operations run at once (default: 8)"
+                    },
+                    "stopOnError": {
+                        "type": "boolean",
+                        "description": "Skip remaining operations after the first error"
+                    }
+                },
+                "required": ["operations"]
+            }
+        }
+    ]
+    return tools
+
+
+def _compile_validators(tools: List[Dict[str, Any]]) -> Dict[str, Callable[[Any], Optional[str]]]:
+    """
+    Compile each tool's input schema into a validator.
+
+    Args:
+        tools: Tool definitions with inputSchema entries
+
+    Returns:
+        Dict of tool name to a function returning an error message or None;
+        empty when fastjsonschema is not installed
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return {}
+
+    def wrap(check: Callable[[Any], Any]) -> Callable[[Any], Optional[str]]:
+        def validate(arguments: Any) -> Optional[str]:
+            try:
+                check(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return e.message
+            return None
+        return validate
+
+    return {tool["name"]: wrap(fastjsonschema.compile(tool["inputSchema"])) for tool in tools}
+
+
+@lru_cache(maxsize=None)
+def _http_server_classes() -> Tuple[type, type]:
+    """
+    Build the standard library server and handler classes once per process.
+
+    http.server is imported here rather than at module level so CLI startup,
+    which imports this module to register its parser, does not pay for it.
+
+    Returns:
+        Tuple of (server class, request handler class)
+    """
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    class MCPHTTPServer(ThreadingHTTPServer):
+        """Threaded HTTP server holding the MCP server its handlers call."""
+
+        def __init__(self, server_address, handler_class, mcp_server, reuse_port=False):
+            self.mcp_server = mcp_server
+            self.reuse_port = reuse_port
+            super().__init__(server_address, handler_class)
+
+        def server_bind(self):
+            if self.reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            super().server_bind()
+
+    class MCPHandler(BaseHTTPRequestHandler):
+        """Routes /tools and /call requests to the server's VaultRunnerMCPServer."""
+
+        # HTTP/1.1 keeps client connections open between calls
+        protocol_version = "HTTP/1.1"
+
+        # Buffer writes so headers and body leave in one send; the base
+        # handler flushes after every request
+        wbufsize = 1 << 16
+
+        def _send_body(self, status: int, body: bytes = b"", close: bool = False) -> None:
+            self.send_response(status)
+            if body:
+                self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            # send_header also sets close_connection from this value
+            self.send_header('Connection', 'close' if close else 'keep-alive')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/tools":
+                self._send_body(200, self.server.mcp_server._tools_response)  # type: ignore
+            else:
+                self._send_body(404)
+
+        def do_POST(self):
+            if self.path == "/call":
+                # Only Content-Length framed bodies are read; anything else
+                # would leave body bytes to be parsed as the next request
+                if 'Transfer-Encoding' in self.headers:
+                    self._send_body(501, close=True)
+                    return
+                if 'Content-Length' not in self.headers:
+                    self._send_body(411, close=True)
+                    return
+
+                try:
+                    content_length = int(self.headers['Content-Length'])
+                except ValueError:
+                    content_length = -1
+
+                # Refuse before reading so a client cannot force a large allocation
+                if not 0 <= content_length <= VaultRunnerMCPServer.MAX_REQUEST_SIZE:
+                    self._send_body(413 if content_length > 0 else 400, close=True)
+                    return
+
+                post_data = self.rfile.read(content_length)
+                try:
+                    data = fastjson.loads(post_data)
+                    tool_name = data.get("tool")
+                    arguments = data.get("arguments", {})
+
+                    result = self.server.mcp_server.handle_tool_call(tool_name, arguments)  # type: ignore
+                    body = fastjson.dumps_bytes(result)
+                    status = 200
+                except Exception as e:
+                    body = fastjson.dumps_bytes({"error": str(e)})
+                    status = 500
+                self._send_body(status, body)
+            else:
+                # The unread request body would corrupt the next request
+                self._send_body(404, close=True)
+
+    return MCPHTTPServer, MCPHandler
+
+
 class VaultRunnerMCPServer:
     """MCP Server implementation for VaultRunner."""
 
-    def __init__(self, port: int = 3000, vault_addr: Optional[str] = None, vault_token: Optional[str] = None):
+    # Default concurrency for batch_execute operations
+    BATCH_MAX_CONCURRENT = 8
+
+    # Seconds a worker must run before it is restarted after exiting
+    WORKER_MIN_UPTIME = 1.0
+
+    # Largest accepted request body in bytes
+    MAX_REQUEST_SIZE = 1 << 20
+
+    # CPU-bound tools run in worker processes when the process pool is enabled
+    PROCESS_POOL_TOOLS = frozenset({
+        "vault_secure_init",
+        "vault_generate_ssl",
+        "vault_encrypt_key",
+        "vault_decrypt_key",
+        "vault_export_key",
+    })
+
+    def __init__(
+        self,
+        port: int = 3000,
+        vault_addr: Optional[str] = None,
+        vault_token: Optional[str] = None,
+        workers: int = 1,
+        process_pool: bool = False,
+        require_accel: bool = False,
+        cache_keys: bool = True,
+    ):
         self.port = port
+        self.workers = workers
+        self.process_pool = process_pool
+        self.require_accel = require_accel
+        self.cache_keys = cache_keys
         self.vault_addr = vault_addr
         self.vault_token = vault_token
         self.config = VaultRunnerConfig()
-        self.key_manager = SecureKeyManager(self.config.vault_dir)
+        # Imported here so registering the mcp-server parser does not load the crypto stack
+        from ..security.key_manager import SecureKeyManager
+
+        self.key_manager = SecureKeyManager(self.config.vault_dir, cache_keys=cache_keys)
+        # Tool definitions are static, so the /tools response is serialized once
+        self._tools = _build_tools()
+        self._tools_response = fastjson.dumps_bytes({"tools": self._tools})
+        self._validators = _compile_validators(self._tools)
+
+        # Tool name to handler
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "vault_secure_init": self._handle_secure_init,
+            "vault_generate_ssl": self._handle_generate_ssl,
+            "vault_encrypt_key": self._handle_encrypt_key,
+            "vault_decrypt_key": self._handle_decrypt_key,
+            "vault_export_key": self._handle_export_key,
+            "batch_execute": self._handle_batch_execute,
+        }
+        # Runs tool calls off the event loop; threads start on first use
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Created by start_server when process_pool is enabled
+        self._process_pool: Optional[ProcessPoolExecutor] = None
 
     def initialize(self):
         """Initialize the MCP server with VaultRunner components."""
@@ -34,90 +371,66 @@ class VaultRunnerMCPServer:
             if self.vault_token:
                 self.config.vault_token = self.vault_token
 
+            self._check_crypto_backend()
+
             logger.info("MCP Server initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize MCP server: {e}")
+            logger.error("Failed to initialize MCP server: %s", e)
             raise
 
+    def _check_crypto_backend(self) -> None:
+        """Log the OpenSSL build and CPU crypto extensions in use."""
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        logger.info("Crypto backend: %s", backend.openssl_version_text())
+
+        require_aes = self.require_accel or os.environ.get("VAULTRUNNER_REQUIRE_AESNI") == "1"
+        if _aesni_disabled_by_env():
+            if require_aes:
+                raise RuntimeError("AES-NI is disabled by OPENSSL_ia32cap")
+            logger.warning("OPENSSL_ia32cap disables AES-NI, AES will run in software")
+
+        features = _cpu_crypto_features()
+        if features is None:
+            if self.require_accel:
+                raise RuntimeError("Cannot detect CPU crypto extensions on this platform")
+            logger.info("CPU crypto extensions: unknown on this platform")
+            return
+
+        summary = ", ".join(
+            f"{name}: {'yes' if present else 'no'}" for name, present in features.items()
+        )
+        if all(features.values()):
+            logger.info("CPU crypto extensions: %s", summary)
+            return
+
+        if self.require_accel:
+            raise RuntimeError(f"Required CPU crypto extensions missing ({summary})")
+        logger.warning("CPU crypto extensions: %s; crypto will be slower", summary)
+
     def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get list of available MCP tools."""
-        tools = [
-            {
-                "name": "vault_secure_init",
-                "description": "Initialize secure vault with password protection",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "password": {"type": "string", "description": "Master password for vault"}
-                    },
-                    "required": ["password"]
-                }
-            },
-            {
-                "name": "vault_generate_ssl",
-                "description": "Generate SSL certificates for Vault",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "common_name": {"type": "string", "description": "Common name for certificate"}
-                    }
-                }
-            },
-            {
-                "name": "vault_encrypt_key",
-                "description": "Encrypt a vault key with password protection",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "vault_key": {"type": "string", "description": "Vault key to encrypt"},
-                        "password": {"type": "string", "description": "Password for encryption"}
-                    },
-                    "required": ["vault_key", "password"]
-                }
-            },
-            {
-                "name": "vault_decrypt_key",
-                "description": "Decrypt a vault key",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "encrypted_key": {"type": "string", "description": "Encrypted key data"},
-                        "password": {"type": "string", "description": "Password for decryption"}
-                    },
-                    "required": ["encrypted_key", "password"]
-                }
-            },
-            {
-                "name": "vault_export_key",
-                "description": "Export encrypted vault key for backup",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "password": {"type": "string", "description": "Password to decrypt key"}
-                    },
-                    "required": ["password"]
-                }
-            }
-        ]
-        return tools
+        return self._tools
 
     def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP tool calls."""
         try:
-            if tool_name == "vault_secure_init":
-                return self._handle_secure_init(arguments)
-            elif tool_name == "vault_generate_ssl":
-                return self._handle_generate_ssl(arguments)
-            elif tool_name == "vault_encrypt_key":
-                return self._handle_encrypt_key(arguments)
-            elif tool_name == "vault_decrypt_key":
-                return self._handle_decrypt_key(arguments)
-            elif tool_name == "vault_export_key":
-                return self._handle_export_key(arguments)
-            else:
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
                 return {"error": f"Unknown tool: {tool_name}"}
+
+            validate = self._validators.get(tool_name)
+            if validate is not None:
+                error = validate(arguments)
+                if error:
+                    return {"error": f"Invalid arguments for {tool_name}: {error}"}
+
+            if self._process_pool is not None and tool_name in self.PROCESS_POOL_TOOLS:
+                return self._process_pool.submit(_worker_call, tool_name, arguments).result()
+
+            return handler(arguments)
         except Exception as e:
-            logger.error(f"Error handling tool call {tool_name}: {e}")
+            logger.error("Error handling tool call %s: %s", tool_name, e)
             return {"error": str(e)}
 
     def _handle_secure_init(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -188,59 +501,184 @@ class VaultRunnerMCPServer:
         except Exception as e:
             return {"error": f"Failed to export vault key: {e}"}
 
+    def _handle_batch_execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle batch_execute tool call."""
+        operations = args.get("operations") or []
+        max_concurrent = max(1, int(args.get("maxConcurrent", self.BATCH_MAX_CONCURRENT)))
+        stop_on_error = bool(args.get("stopOnError", False))
+
+        def run(operation: Any) -> Dict[str, Any]:
+            if not isinstance(operation, dict):
+                return {"error": "Operation must be an object"}
+            tool_name = operation.get("tool")
+            if tool_name == "batch_execute":
+                return {"error": "batch_execute cannot be nested"}
+            return self.handle_tool_call(tool_name, operation.get("arguments") or {})
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(operations)
+        if operations:
+            with ThreadPoolExecutor(max_workers=min(max_concurrent, len(operations))) as pool:
+                futures = [pool.submit(run, operation) for operation in operations]
+                for future in as_completed(futures):
+                    if stop_on_error and "error" in future.result():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+            # Operations already running when an error stopped the batch still report
+            for index, future in enumerate(futures):
+                if not future.cancelled():
+                    results[index] = future.result()
+
+        final = [
+            result if result is not None else {"error": "Skipped after an earlier error"}
+            for result in results
+        ]
+        return {
+            "result": f"Executed {len(operations)} operations",
+            "error_count": sum(1 for result in final if "error" in result),
+            "results": final
+        }
+
     def start_server(self):
         """Start the MCP server."""
         self.initialize()
 
-        # Simple HTTP server using built-in modules
-        from http.server import HTTPServer, BaseHTTPRequestHandler
-        import urllib.parse
-
-        class MCPHandler(BaseHTTPRequestHandler):
-            def do_GET(self):
-                if self.path == "/tools":
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    tools = self.server.mcp_server.get_available_tools()  # type: ignore
-                    self.wfile.write(json.dumps({"tools": tools}).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-
-            def do_POST(self):
-                if self.path == "/call":
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    try:
-                        data = json.loads(post_data.decode())
-                        tool_name = data.get("tool")
-                        arguments = data.get("arguments", {})
-
-                        result = self.server.mcp_server.handle_tool_call(tool_name, arguments)  # type: ignore
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(result).encode())
-                    except Exception as e:
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({"error": str(e)}).encode())
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-
-        # Create server with MCP server instance
-        server = HTTPServer(('localhost', self.port), MCPHandler)
-        # Store reference to MCP server instance
-        server.mcp_server = self  # type: ignore
-
-        logger.info(f"Starting MCP server on port {self.port}")
+        logger.info("Starting MCP server on port %d", self.port)
         logger.info("Available endpoints:")
         logger.info("  GET  /tools - List available tools")
         logger.info("  POST /call  - Execute tool calls")
 
+        reuse_port = self._can_reuse_port()
+        if reuse_port and self._supervise_workers():
+            # Supervisor process, returning once every worker has exited
+            return
+
+        # Created after forking so each server process owns its pool
+        if self.process_pool:
+            # Workers start lazily from request threads; forking then could copy
+            # a lock another thread holds, so they come from a forkserver instead
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_worker,
+                initargs=(self.vault_addr, self.vault_token, self.cache_keys),
+            )
+
+        try:
+            from aiohttp import web
+        except ImportError:
+            logger.info("aiohttp not installed, using the built-in HTTP server")
+            self._serve_http(reuse_port)
+        else:
+            self._serve_aiohttp(web, reuse_port)
+        finally:
+            self._pool.shutdown(wait=False)
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False)
+
+    def _can_reuse_port(self) -> bool:
+        """Check whether several server processes can share the listening port."""
+        if self.workers <= 1:
+            return False
+
+        if not hasattr(socket, "SO_REUSEPORT") or not hasattr(os, "fork"):
+            logger.warning("SO_REUSEPORT is not supported on this platform, running one worker")
+            return False
+        return True
+
+    def _supervise_workers(self) -> bool:
+        """
+        Fork the server processes that share the listening port and supervise them.
+
+        The parent does not serve. It restarts workers that exit unexpectedly
+        and forwards SIGTERM/SIGINT to them, then waits for all of them to exit.
+
+        Returns:
+            False inside a worker, which should go on to serve; True in the
+            supervisor once every worker has exited
+        """
+        import signal
+        import time
+
+        children: Dict[int, float] = {}
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+            for pid in children:
+                try:
+                    os.kill(pid, signum)
+                except ProcessLookupError:
+                    pass
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        while True:
+            # The kernel balances incoming connections across all workers
+            while not stopping and len(children) < self.workers:
+                pid = os.fork()
+                if pid == 0:
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    signal.signal(signal.SIGINT, signal.default_int_handler)
+                    logger.info("MCP worker %d listening on port %d", os.getpid(), self.port)
+                    return False
+                children[pid] = time.monotonic()
+
+            if not children:
+                return True
+
+            pid, status = os.wait()
+            started = children.pop(pid, None)
+            if stopping or started is None:
+                continue
+
+            logger.warning("MCP worker %d exited with status %d", pid, status)
+            if time.monotonic() - started < self.WORKER_MIN_UPTIME:
+                # Restarting a worker that cannot start would only loop
+                logger.error("MCP worker failed right after starting, stopping the server")
+                stop(signal.SIGTERM, None)
+
+    def _serve_aiohttp(self, web: Any, reuse_port: bool = False) -> None:
+        """Serve requests with aiohttp, running tool calls on the worker pool."""
+
+        async def list_tools(request):
+            return web.Response(body=self._tools_response, content_type="application/json")
+
+        async def call_tool(request):
+            try:
+                data = await request.json(loads=fastjson.loads)
+                tool_name = data.get("tool")
+                arguments = data.get("arguments", {})
+
+                # Crypto work is CPU-bound, so keep it off the event loop
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._pool, self.handle_tool_call, tool_name, arguments
+                )
+            except Exception as e:
+                return web.json_response({"error": str(e)}, status=500, dumps=fastjson.dumps)
+            return web.json_response(result, dumps=fastjson.dumps)
+
+        app = web.Application(client_max_size=self.MAX_REQUEST_SIZE)
+        app.router.add_get("/tools", list_tools)
+        app.router.add_post("/call", call_tool)
+
+        # run_app handles Ctrl+C itself and shuts down cleanly
+        web.run_app(
+            app, host="localhost", port=self.port, reuse_port=reuse_port or None, print=None
+        )
+        logger.info("MCP Server stopped")
+
+    def _serve_http(self, reuse_port: bool = False) -> None:
+        """Serve requests with the standard library HTTP server."""
+        server_class, handler_class = _http_server_classes()
+
+        # Each connection gets a daemon thread, so slow crypto calls do not
+        # block other clients
+        server = server_class(('localhost', self.port), handler_class, self, reuse_port)
+
         try:
             server.serve_forever()
         except KeyboardInterrupt:
@@ -248,6 +686,24 @@ class VaultRunnerMCPServer:
             server.shutdown()
 
 
+# Per-process server used by process pool workers
+_worker_server: Optional[VaultRunnerMCPServer] = None
+
+
+def _init_worker(vault_addr: Optional[str], vault_token: Optional[str], cache_keys: bool) -> None:
+    """Create the tool handler for a process pool worker."""
+    global _worker_server
+    _worker_server = VaultRunnerMCPServer(
+        vault_addr=vault_addr, vault_token=vault_token, cache_keys=cache_keys
+    )
+    _worker_server.initialize()
+
+
+def _worker_call(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a tool call inside a process pool worker."""
+    return _worker_server.handle_tool_call(tool_name, arguments)  # type: ignore
+
+
 def register_mcp_parser(subparsers):
     """Register MCP server parser."""
     mcp_parser = subparsers.add_parser(
@@ -275,6 +731,31 @@ def register_mcp_parser(subparsers):
         help="Vault authentication token"
     )
 
+    mcp_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Supervised server processes sharing the port via SO_REUSEPORT (default: 1)"
+    )
+
+    mcp_parser.add_argument(
+        "--process-pool",
+        action="store_true",
+        help="Run crypto tool calls in a pool of worker processes"
+    )
+
+    mcp_parser.add_argument(
+        "--require-accel",
+        action="store_true",
+        help="Refuse to start unless AES, SHA and carry-less multiply CPU extensions are available"
+    )
+
+    mcp_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not keep derived keys in memory between tool calls"
+    )
+
     mcp_parser.set_defaults(func=run_mcp_server)
 
 
@@ -283,7 +764,11 @@ def run_mcp_server(args):
     server = VaultRunnerMCPServer(
         port=args.port,
         vault_addr=args.vault_addr,
-        vault_token=args.vault_token
+        vault_token=args.vault_token,
+        workers=args.workers,
+        process_pool=args.process_pool,
+        require_accel=args.require_accel,
+        cache_keys=not args.no_cache
     )
 
     try:
@@ -291,7 +776,7 @@ def run_mcp_server(args):
     except KeyboardInterrupt:
         logger.info("MCP Server stopped by user")
     except Exception as e:
-        logger.error(f"MCP Server error: {e}")
+        logger.error("MCP Server error: %s", e)
         return 1
 
     return 0
\ No newline at end of file
@@ -8,28 +8,132 @@ to HashiCorp Vault with namespace support.
 import os
 import yaml
 import re
-from typing import Dict, Optional, Any
+import logging
+import itertools
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Iterator, Tuple
 from ..models.config import VaultRunnerConfig
-from ..vault.client import VaultClient
+from ..utils.lazy_parser import LazySubparsers
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from ..vault.client import VaultClient
+
 logger = get_logger(__name__)
 
+# libyaml-backed safe loader and dumper when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# KEY=value line of a .env file, with optional surrounding quotes on the value
+_ENV_LINE_RE = re.compile(r'^\s*([^#=\s][^=]*?)\s*=\s*["\']?(.*?)["\']?\s*$')
+
+# Value with surrounding whitespace and an optional pair of quotes
+_UNQUOTE_RE = re.compile(r'\s*["\']?(.*?)["\']?\s*$', re.DOTALL)
+
+
+def _unquote(value: str) -> str:
+    """Strip surrounding whitespace and quotes from a value in one pass."""
+    return _UNQUOTE_RE.match(value).group(1)
+
+
+def _iter_compose_env(compose_data: Dict[str, Any]) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (service, key, unquoted value, source) for each string env var in a compose file."""
+    for service_name, service_config in compose_data.get("services", {}).items():
+        env_vars = service_config.get("environment", {})
+
+        # Handle both list and dict formats
+        if isinstance(env_vars, list):
+            for env_var in env_vars:
+                key, sep, value = env_var.partition("=")
+                if sep:
+                    yield service_name, key.strip(), _unquote(value), "environment_list"
+        elif isinstance(env_vars, dict):
+            for key, value in env_vars.items():
+                if isinstance(value, str):
+                    yield service_name, key, _unquote(value), "environment_dict"
+
+
+class ComposeDumper(_YAML_DUMPER):
+    """Block-style dumper used to rewrite compose files, keeping their key order."""
+
+    def __init__(self, stream: Any, **kwargs: Any):
+        kwargs["default_flow_style"] = False
+        kwargs["sort_keys"] = False
+        super().__init__(stream, **kwargs)
+
+
+@dataclass(frozen=True)
+class DetectedEvent:
+    """A potential secret found during smart migration."""
+
+    secret_key: str
+    service: str
+    key: str
+
+
+@dataclass(frozen=True)
+class SkippedEvent:
+    """A detected secret that will not be migrated."""
+
+    secret_key: str
+
+
+@dataclass(frozen=True)
+class MigratedEvent:
+    """A secret write to Vault finished, successfully or not."""
+
+    secret_key: str
+    vault_path: str
+    success: bool
+
+
+@dataclass(frozen=True)
+class ImportedEvent:
+    """The post-migration import ran."""
+
+    result: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class CompletedEvent:
+    """Smart migration finished; carries the result summary."""
+
+    summary: Dict[str, Any]
+
 
 class MigrationService:
     """Service for migrating secrets from various sources."""
 
-    # Common secret patterns to look for
-    SECRET_PATTERNS = [
-        re.compile(r'.*_(?:KEY|TOKEN|SECRET|PASS|PASSWORD|PWD|CRED)$', re.IGNORECASE),
-        re.compile(r'^(?:API|DB|DATABASE)_.*', re.IGNORECASE),
-        re.compile(r'.*(?:AUTH|JWT|OAUTH|BEARER).*$', re.IGNORECASE),
-        re.compile(r'.*(?:PRIVATE|SECRET)_.*', re.IGNORECASE),
-    ]
+    # Common secret patterns to look for, combined so a key is matched in one pass.
+    # Matched against the uppercased key, so no IGNORECASE is needed.
+    SECRET_PATTERN = re.compile(
+        r'(?:.*_(?:KEY|TOKEN|SECRET|PASS|PASSWORD|PWD|CRED)$)'
+        r'|(?:(?:API|DB|DATABASE)_)'
+        r'|(?:.*(?:AUTH|JWT|OAUTH|BEARER).*$)'
+        r'|(?:.*(?:PRIVATE|SECRET)_)'
+    )
+
+    # Every secret pattern needs one of these words; keys without any skip the regex
+    SECRET_KEYWORDS = (
+        "KEY", "TOKEN", "SECRET", "PASS", "PWD", "CRED", "API", "DB", "DATABASE",
+        "AUTH", "JWT", "BEARER", "PRIVATE",
+    )
 
-    def __init__(self, config: VaultRunnerConfig, vault_client: VaultClient):
+    # Secrets written per batch_put call during a migration
+    WRITE_BATCH_SIZE = 100
+
+    def __init__(self, config: VaultRunnerConfig, vault_client: "VaultClient"):
         self.config = config
         self.vault_client = vault_client
+        # Parsed compose files by path, with the mtime they were parsed at
+        self._compose_cache: Dict[str, Tuple[int, Any]] = {}
+
+    @cached_property
+    def _default_namespace(self) -> str:
+        """Namespace from configuration, used when no namespace is given."""
+        return self.config.get_effective_namespace()
 
     def migrate_from_env_file(
         self, env_file_path: str, namespace: Optional[str] = None
@@ -46,14 +150,14 @@ class MigrationService:
         """
         logger.info("Starting migration from env file: %s", env_file_path)
 
-        if not os.path.exists(env_file_path):
-            raise FileNotFoundError(f"Env file not found: {env_file_path}")
-
         # Parse env file
-        secrets = self._parse_env_file(env_file_path)
+        try:
+            secrets = self._parse_env_file(env_file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Env file not found: {env_file_path}") from None
 
         # Set target namespace
-        target_namespace = namespace or self.config.get_effective_namespace()
+        target_namespace = namespace or self._default_namespace
 
         # Migrate secrets
         result = self._migrate_secrets_batch(
@@ -82,16 +186,16 @@ class MigrationService:
         """
         logger.info("Starting migration from docker-compose: %s", compose_file_path)
 
-        if not os.path.exists(compose_file_path):
+        # Parse docker-compose file
+        try:
+            secrets = self._parse_docker_compose(compose_file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Docker compose file not found: {compose_file_path}"
-            )
-
-        # Parse docker-compose file
-        secrets = self._parse_docker_compose(compose_file_path)
+            ) from None
 
         # Set target namespace
-        target_namespace = namespace or self.config.get_effective_namespace()
+        target_namespace = namespace or self._default_namespace
 
         # Migrate secrets
         result = self._migrate_secrets_batch(
@@ -124,7 +228,7 @@ class MigrationService:
         secrets = {}  # TODO: Implement kubernetes secret reading
 
         # Set target namespace
-        target_namespace = vault_namespace or self.config.get_effective_namespace()
+        target_namespace = vault_namespace or self._default_namespace
 
         # Migrate secrets
         result = self._migrate_secrets_batch(
@@ -151,7 +255,7 @@ class MigrationService:
         Returns:
             Formatted env content
         """
-        source_namespace = namespace or self.config.get_effective_namespace()
+        source_namespace = namespace or self._default_namespace
         logger.info(
             "Exporting secrets from namespace '%s' to env format",
             source_namespace
@@ -161,7 +265,8 @@ class MigrationService:
         secrets = self._get_secrets_from_namespace(source_namespace)
 
         # Format as env
-        env_content = self._format_as_env(secrets)
+        # Only file output needs a stable order for diffs
+        env_content = self._format_as_env(secrets, sort=bool(output_file))
 
         if output_file:
             with open(output_file, "w", encoding="utf-8") as f:
@@ -183,7 +288,7 @@ class MigrationService:
         Returns:
             Formatted docker-compose env content
         """
-        source_namespace = namespace or self.config.get_effective_namespace()
+        source_namespace = namespace or self._default_namespace
         logger.info(
             "Exporting secrets from namespace '%s' to docker-compose format",
             source_namespace
@@ -193,7 +298,8 @@ class MigrationService:
         secrets = self._get_secrets_from_namespace(source_namespace)
 
         # Format for docker-compose
-        compose_content = self._format_as_docker_compose_env(secrets)
+        # Only file output needs a stable order for diffs
+        compose_content = self._format_as_docker_compose_env(secrets, sort=bool(output_file))
 
         if output_file:
             with open(output_file, "w", encoding="utf-8") as f:
@@ -223,20 +329,51 @@ class MigrationService:
         Returns:
             Migration result summary
         """
-        logger.info("Starting smart migration from docker-compose: %s", compose_file_path)
+        summary: Dict[str, Any] = {}
+        for event in self.iter_smart_migrate(
+            compose_file_path, namespace, auto_migrate, interactive, auto_import
+        ):
+            if isinstance(event, CompletedEvent):
+                summary = event.summary
+        return summary
+
+    def iter_smart_migrate(
+        self,
+        compose_file_path: str,
+        namespace: Optional[str] = None,
+        auto_migrate: bool = False,
+        interactive: bool = True,
+        auto_import: bool = False
+    ) -> Iterator[Any]:
+        """
+        Smart migration that reports progress as events while it runs.
 
-        if not os.path.exists(compose_file_path):
-            raise FileNotFoundError(f"Docker compose file not found: {compose_file_path}")
+        Takes the same arguments as smart_migrate_docker_compose.
+
+        Yields:
+            DetectedEvent, SkippedEvent, MigratedEvent and ImportedEvent as
+            the migration progresses, then a CompletedEvent with the summary
+        """
+        logger.info("Starting smart migration from docker-compose: %s", compose_file_path)
 
         # Parse docker-compose file
-        detected_secrets = self._detect_potential_secrets(compose_file_path)
+        try:
+            detected_secrets = self._detect_potential_secrets(compose_file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Docker compose file not found: {compose_file_path}"
+            ) from None
 
         if not detected_secrets:
             logger.info("No potential secrets detected in docker-compose file")
-            return {"detected": 0, "migrated": 0, "skipped": 0}
+            yield CompletedEvent({"detected": 0, "migrated": 0, "skipped": 0})
+            return
+
+        for secret_key, metadata in detected_secrets.items():
+            yield DetectedEvent(secret_key, metadata["service"], metadata["key"])
 
         # Set target namespace
-        target_namespace = namespace or self.config.get_effective_namespace()
+        target_namespace = namespace or self._default_namespace
 
         # Ensure only one import mode is active
         if auto_migrate:
@@ -244,21 +381,35 @@ class MigrationService:
         # If both are False, skip migration
         if not auto_migrate and not interactive:
             logger.info("No migration mode selected (auto_migrate and interactive both False)")
-            return {"detected": len(detected_secrets), "migrated": 0, "skipped": len(detected_secrets)}
+            for secret_key in detected_secrets:
+                yield SkippedEvent(secret_key)
+            yield CompletedEvent({
+                "detected": len(detected_secrets), "migrated": 0, "skipped": len(detected_secrets)
+            })
+            return
 
         # Filter and confirm secrets to migrate
         secrets_to_migrate = self._filter_and_confirm_secrets(
             detected_secrets, auto_migrate, interactive
         )
+        for secret_key in detected_secrets:
+            if secret_key not in secrets_to_migrate:
+                yield SkippedEvent(secret_key)
 
         if not secrets_to_migrate:
             logger.info("No secrets selected for migration")
-            return {"detected": len(detected_secrets), "migrated": 0, "skipped": len(detected_secrets)}
+            yield CompletedEvent({
+                "detected": len(detected_secrets), "migrated": 0, "skipped": len(detected_secrets)
+            })
+            return
 
-        # Migrate selected secrets to Vault
-        migration_result = self._migrate_secrets_batch(
-            secrets_to_migrate, target_namespace, source="smart_migration"
-        )
+        # Migrate selected secrets to Vault, reporting each batch as it lands
+        migrated = 0
+        for secret_key, vault_path, success in self._iter_migrate_writes(
+            secrets_to_migrate, target_namespace
+        ):
+            migrated += success
+            yield MigratedEvent(secret_key, vault_path, success)
 
         # Update Docker Compose file with Vault references
         if not self.config.dry_run:
@@ -270,23 +421,27 @@ class MigrationService:
 
         # Handle automatic import
         import_result = None
-        if auto_import and migration_result["success_count"] > 0:
+        if auto_import and migrated > 0:
             logger.info("Running automatic import after migration...")
             import_result = self._run_automatic_import(target_namespace)
-        elif interactive and migration_result["success_count"] > 0:
+        elif interactive and migrated > 0:
             import_result = self._ask_and_run_import(target_namespace)
 
+        if import_result:
+            yield ImportedEvent(import_result)
+
+        skipped = len(detected_secrets) - len(secrets_to_migrate)
         logger.info(
             "Smart migration completed. Detected: %d, Migrated: %d, Skipped: %d",
             len(detected_secrets),
-            migration_result["success_count"],
-            len(detected_secrets) - len(secrets_to_migrate)
+            migrated,
+            skipped
         )
 
         result = {
             "detected": len(detected_secrets),
-            "migrated": migration_result["success_count"],
-            "skipped": len(detected_secrets) - len(secrets_to_migrate),
+            "migrated": migrated,
+            "skipped": skipped,
             "namespace": target_namespace,
             "updated_file": compose_file_path if not self.config.dry_run else None
         }
@@ -294,7 +449,7 @@ class MigrationService:
         if import_result:
             result["imported"] = import_result
 
-        return result
+        yield CompletedEvent(result)
 
     def _run_automatic_import(self, namespace: str) -> Dict[str, Any]:
         """
@@ -334,17 +489,19 @@ class MigrationService:
             Import result if run, None if skipped
         """
         try:
-            # Ask user for import preference
-            print("\n" + "="*50)
-            print("MIGRATION COMPLETE!")
-            print("="*50)
-            print(f"Secrets have been migrated to namespace: {namespace}")
-            print("\nWould you like to run the import command now?")
-            print("This will import secrets from your configured sources.")
-            print("\nOptions:")
-            print("1. Run import now (recommended)")
-            print("2. Skip import (you can run it later manually)")
-            print("3. Run import with custom options")
+            # Ask user for import preference, written out as one block
+            print("\n".join((
+                "\n" + "=" * 50,
+                "MIGRATION COMPLETE!",
+                "=" * 50,
+                f"Secrets have been migrated to namespace: {namespace}",
+                "\nWould you like to run the import command now?",
+                "This will import secrets from your configured sources.",
+                "\nOptions:",
+                "1. Run import now (recommended)",
+                "2. Skip import (you can run it later manually)",
+                "3. Run import with custom options",
+            )))
 
             while True:
                 try:
@@ -355,8 +512,10 @@ class MigrationService:
                         return self._run_automatic_import(namespace)
 
                     elif choice == "2":
-                        print("\nSkipping import. You can run it later with:")
-                        print(f"  vaultrunner import --namespace {namespace}")
+                        print(
+                            "\nSkipping import. You can run it later with:\n"
+                            f"  vaultrunner import --namespace {namespace}"
+                        )
                         return None
 
                     elif choice == "3":
@@ -385,8 +544,7 @@ class MigrationService:
 
         except (ValueError, RuntimeError, OSError) as e:
             logger.error("Interactive import prompt failed: %s", str(e))
-            print(f"\nError during import prompt: {e}")
-            print("You can run import manually later.")
+            print(f"\nError during import prompt: {e}\nYou can run import manually later.")
             return None
 
     def _detect_potential_secrets(self, compose_file_path: str) -> Dict[str, Dict[str, Any]]:
@@ -396,50 +554,23 @@ class MigrationService:
         Returns:
             Dict of detected secrets with metadata
         """
-        detected_secrets = {}
-
         try:
-            with open(compose_file_path, "r", encoding="utf-8") as f:
-                compose_data = yaml.safe_load(f)
-
-            services = compose_data.get("services", {})
-            for service_name, service_config in services.items():
-                env_vars = service_config.get("environment", {})
-
-                # Handle both list and dict formats
-                if isinstance(env_vars, list):
-                    for env_var in env_vars:
-                        if "=" in env_var:
-                            key, value = env_var.split("=", 1)
-                            key = key.strip()
-                            value = value.strip().strip('"').strip("'")
-
-                            if self._is_potential_secret(key, value):
-                                detected_secrets[f"{service_name}_{key}"] = {
-                                    "service": service_name,
-                                    "key": key,
-                                    "value": value,
-                                    "source": "environment_list"
-                                }
-
-                elif isinstance(env_vars, dict):
-                    for key, value in env_vars.items():
-                        if isinstance(value, str):
-                            value = value.strip().strip('"').strip("'")
-
-                            if self._is_potential_secret(key, str(value)):
-                                detected_secrets[f"{service_name}_{key}"] = {
-                                    "service": service_name,
-                                    "key": key,
-                                    "value": str(value),
-                                    "source": "environment_dict"
-                                }
-
+            compose_data = self._load_compose(compose_file_path)
         except yaml.YAMLError as e:
             logger.error("Error parsing docker-compose file: %s", e)
             raise
 
-        return detected_secrets
+        # Flatten list and dict environments first, then filter in a single pass
+        return {
+            f"{service_name}_{key}": {
+                "service": service_name,
+                "key": key,
+                "value": value,
+                "source": source,
+            }
+            for service_name, key, value, source in _iter_compose_env(compose_data)
+            if self._is_potential_secret(key, value)
+        }
 
     def _is_potential_secret(self, key: str, value: str) -> bool:
         """
@@ -453,12 +584,13 @@ class MigrationService:
         if value.startswith(("http://", "https://", "localhost", "/")):
             return False
 
-        # Check against secret patterns
-        for pattern in self.SECRET_PATTERNS:
-            if pattern.match(key):
-                return True
+        # Cheap keyword gate before running the regex
+        upper = key.upper()
+        if not any(word in upper for word in self.SECRET_KEYWORDS):
+            return False
 
-        return False
+        # Check against secret patterns
+        return self.SECRET_PATTERN.match(upper) is not None
 
     def _filter_and_confirm_secrets(
         self,
@@ -503,16 +635,20 @@ class MigrationService:
         """
         Update Docker Compose file to use Vault Runner sidecar secret references.
         """
+        if not migrated_secrets:
+            return
+
         try:
-            with open(compose_file_path, "r", encoding="utf-8") as f:
-                compose_data = yaml.safe_load(f)
+            # Take the parse out of the cache since it is modified below
+            compose_data = self._load_compose(compose_file_path)
+            self._compose_cache.pop(compose_file_path, None)
 
             # Track which secrets were updated
             updated_secrets = {}
 
             # Update environment variables to use Vault references
             services = compose_data.get("services", {})
-            for _service_name, service_config in services.items():
+            for service_name, service_config in services.items():
                 env_vars = service_config.get("environment", {})
 
                 if isinstance(env_vars, list):
@@ -522,31 +658,33 @@ class MigrationService:
                             key, _ = env_var.split("=", 1)
                             key = key.strip()
 
-                            # Check if this key was migrated
-                            for secret_key, _ in migrated_secrets.items():
-                                if secret_key.endswith(f"_{key}"):
-                                    vault_ref = f"${{VAULT_SECRET_{namespace}/{secret_key}}}"
-                                    env_vars[i] = f"{key}={vault_ref}"
-                                    updated_secrets[secret_key] = vault_ref
-                                    break
+                            # Check if this key was migrated (keys are "<service>_<var>")
+                            secret_key = f"{service_name}_{key}"
+                            if secret_key in migrated_secrets:
+                                vault_ref = f"${{VAULT_SECRET_{namespace}/{secret_key}}}"
+                                env_vars[i] = f"{key}={vault_ref}"
+                                updated_secrets[secret_key] = vault_ref
 
                 elif isinstance(env_vars, dict):
                     # Handle dict format
-                    for key, _value in list(env_vars.items()):
-                        # Check if this key was migrated
-                        for secret_key, _ in migrated_secrets.items():
-                            if secret_key.endswith(f"_{key}"):
-                                vault_ref = f"${{VAULT_SECRET_{namespace}/{secret_key}}}"
-                                env_vars[key] = vault_ref
-                                updated_secrets[secret_key] = vault_ref
-                                break
+                    for key in list(env_vars):
+                        # Check if this key was migrated (keys are "<service>_<var>")
+                        secret_key = f"{service_name}_{key}"
+                        if secret_key in migrated_secrets:
+                            vault_ref = f"${{VAULT_SECRET_{namespace}/{secret_key}}}"
+                            env_vars[key] = vault_ref
+                            updated_secrets[secret_key] = vault_ref
 
             # Add Vault Runner sidecar if not present
-            self._add_vault_sidecar(compose_data, namespace)
+            sidecar_added = self._add_vault_sidecar(compose_data, namespace)
+
+            if not updated_secrets and not sidecar_added:
+                logger.info("Docker Compose file already up to date")
+                return
 
             # Write updated compose file
-            with open(compose_file_path, "w", encoding="utf-8") as f:
-                yaml.dump(compose_data, f, default_flow_style=False, sort_keys=False)
+            content = yaml.dump(compose_data, Dumper=ComposeDumper)
+            self._write_file_atomic(compose_file_path, content)
 
             logger.info("Updated Docker Compose file with %d Vault references", len(updated_secrets))
 
@@ -554,16 +692,41 @@ class MigrationService:
             logger.error("Failed to update Docker Compose file: %s", e)
             raise
 
-    def _add_vault_sidecar(self, compose_data: Dict[str, Any], namespace: str) -> None:
+    def _write_file_atomic(self, file_path: str, content: str) -> None:
+        """Write a file in one go through a temporary file renamed over the original."""
+        try:
+            mode = os.stat(file_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+
+        tmp_path = f"{file_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _add_vault_sidecar(self, compose_data: Dict[str, Any], namespace: str) -> bool:
         """
         Add Vault Runner sidecar service to the compose file.
+
+        Returns:
+            True if the sidecar was added, False if it was already present
         """
         services = compose_data.setdefault("services", {})
 
         # Check if sidecar already exists
         if "vault-runner" in services:
             logger.info("Vault Runner sidecar already exists")
-            return
+            return False
 
         # Add Vault server service if not present
         if "vault" not in services:
@@ -619,6 +782,7 @@ class MigrationService:
             volumes["vault_data"] = None
 
         logger.info("Added Vault Runner sidecar to compose file")
+        return True
 
     def _generate_vault_config(self) -> None:
         """
@@ -650,31 +814,43 @@ ui = true
         
         logger.info("Generated vault.hcl config file at: %s", vault_config_path)
 
+    def _load_compose(self, compose_file_path: str) -> Any:
+        """Parse a compose file, reusing the previous parse while the file is unchanged."""
+        mtime = os.stat(compose_file_path).st_mtime_ns
+        cached = self._compose_cache.get(compose_file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(compose_file_path, "r", encoding="utf-8") as f:
+            compose_data = yaml.load(f, Loader=_YAML_LOADER)
+
+        self._compose_cache[compose_file_path] = (mtime, compose_data)
+        return compose_data
+
     def _parse_env_file(self, env_file_path: str) -> Dict[str, str]:
         """Parse a .env file and return key-value pairs."""
         secrets = {}
 
+        # Read the file in one call instead of line by line
         with open(env_file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse key=value
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    secrets[key] = value
-                else:
-                    logger.warning(
-                        "Skipping invalid line %d in %s: %s",
-                        line_num,
-                        env_file_path,
-                        line
-                    )
+            lines = f.read().splitlines()
+
+        for line_num, line in enumerate(lines, 1):
+            # Parse key=value
+            match = _ENV_LINE_RE.match(line)
+            if match:
+                secrets[match.group(1)] = match.group(2)
+                continue
+
+            # Skip empty lines and comments
+            line = line.strip()
+            if line and not line.startswith("#"):
+                logger.warning(
+                    "Skipping invalid line %d in %s: %s",
+                    line_num,
+                    env_file_path,
+                    line
+                )
 
         return secrets
 
@@ -683,8 +859,7 @@ ui = true
         secrets = {}
 
         try:
-            with open(compose_file_path, "r", encoding="utf-8") as f:
-                compose_data = yaml.safe_load(f)
+            compose_data = self._load_compose(compose_file_path)
 
             # Extract environment variables from all services
             services = compose_data.get("services", {})
@@ -719,34 +894,58 @@ ui = true
             "source": source,
         }
 
-        for key, value in secrets.items():
-            try:
-                vault_path = f"secret/{namespace}/{key}"
-
-                if not self.config.dry_run:
-                    self.vault_client.put_secret(vault_path, value)
-
+        for key, _vault_path, success in self._iter_migrate_writes(secrets, namespace):
+            if success:
                 result["success_count"] += 1
-                logger.debug("Migrated secret: %s -> %s", key, vault_path)
-
-            except (ValueError, RuntimeError, OSError) as e:
+            else:
                 result["error_count"] += 1
-                error_msg = "Failed to migrate %s: %s" % (key, str(e))
-                result["errors"].append(error_msg)
-                logger.error(error_msg)
+                result["errors"].append("Failed to migrate %s" % key)
 
         return result
 
+    def _iter_migrate_writes(
+        self, secrets: Dict[str, str], namespace: str
+    ) -> Iterator[Tuple[str, str, bool]]:
+        """Write secrets to Vault in batches, yielding (key, vault_path, success) per secret."""
+        prefix = f"secret/{namespace}/"
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Write in fixed-size batches so large files are flushed to Vault as they go
+        pending = iter(secrets)
+        while True:
+            batch = {prefix + key: key for key in itertools.islice(pending, self.WRITE_BATCH_SIZE)}
+            if not batch:
+                break
+
+            if self.config.dry_run:
+                written = dict.fromkeys(batch, True)
+            else:
+                written = self.vault_client.batch_put(
+                    {vault_path: secrets[key] for vault_path, key in batch.items()}
+                )
+
+            for vault_path, key in batch.items():
+                if written[vault_path]:
+                    if debug:
+                        logger.debug("Migrated secret: %s -> %s", key, vault_path)
+                else:
+                    logger.error("Failed to migrate %s", key)
+                yield key, vault_path, written[vault_path]
+
     def _get_secrets_from_namespace(self, namespace: str) -> Dict[str, str]:
         """Get all secrets from a Vault namespace."""
         try:
             vault_path = f"secret/{namespace}"
             secrets_list = self.vault_client.list_secrets(vault_path)
 
+            secret_paths = {
+                secret_name: f"{vault_path}/{secret_name}" for secret_name in secrets_list or []
+            }
+            values = self.vault_client.batch_get(list(secret_paths.values()))
+
             secrets = {}
-            for secret_name in secrets_list or []:
-                secret_path = f"{vault_path}/{secret_name}"
-                secret_value = self.vault_client.get_secret(secret_path)
+            for secret_name, secret_path in secret_paths.items():
+                secret_value = values[secret_path]
                 if secret_value:
                     secrets[secret_name] = secret_value
 
@@ -756,56 +955,84 @@ ui = true
             logger.error("Error reading secrets from namespace %s: %s", namespace, str(e))
             return {}
 
-    def _format_as_env(self, secrets: Dict[str, str]) -> str:
-        """Format secrets as .env file content."""
-        lines = []
-        lines.append("# Exported from VaultRunner")
-        lines.append(f"# Namespace: {self.config.get_effective_namespace()}")
-        lines.append("")
-
-        for key, value in sorted(secrets.items()):
-            # Escape quotes and special characters
-            escaped_value = value.replace('"', '\\"')
-            lines.append(f'{key}="{escaped_value}"')
-
-        return "\n".join(lines)
-
-    def _format_as_docker_compose_env(self, secrets: Dict[str, str]) -> str:
-        """Format secrets as docker-compose environment section."""
-        lines = []
-        lines.append(
-            "# Add this to your docker-compose.yml service environment section"
+    def _format_as_env(self, secrets: Dict[str, str], sort: bool = True) -> str:
+        """Format secrets as .env file content, optionally sorted by key."""
+        header = (
+            "# Exported from VaultRunner",
+            f"# Namespace: {self._default_namespace}",
+            "",
         )
-        lines.append("environment:")
-
-        for key, value in sorted(secrets.items()):
-            lines.append(f"  - {key}={value}")
+        items = sorted(secrets.items()) if sort else secrets.items()
+
+        # Escape quotes and special characters
+        return "\n".join(itertools.chain(
+            header, ('%s="%s"' % (key, value.replace('"', '\\"')) for key, value in items)
+        ))
+
+    def _format_as_docker_compose_env(self, secrets: Dict[str, str], sort: bool = True) -> str:
+        """Format secrets as docker-compose environment section, optionally sorted by key."""
+        header = (
+            "# Add this to your docker-compose.yml service environment section",
+            "environment:",
+        )
+        items = sorted(secrets.items()) if sort else secrets.items()
 
-        return "\n".join(lines)
+        return "\n".join(itertools.chain(
+            header, (f"  - {key}={value}" for key, value in items)
+        ))
 
 
-def register_migrate_commands(cli_parser):
+def register_migrate_commands(cli_parser, argv: Optional[List[str]] = None):
     """Register migration commands with the CLI parser."""
 
     # Import command
     import_parser = cli_parser.add_parser(
         "import", help="Import secrets from various sources"
     )
-    import_subparsers = import_parser.add_subparsers(
-        dest="import_source", help="Import source"
+    import_subparsers = LazySubparsers(
+        import_parser.add_subparsers(dest="import_source", help="Import source"),
+        "import",
+        argv,
+    )
+
+    # Only the invoked import source parser is built
+    import_subparsers.add_parser("env", _build_import_env_parser, help="Import from .env file")
+    import_subparsers.add_parser(
+        "smart", _build_import_smart_parser, help="Smart migration with secret detection"
     )
+    import_subparsers.materialize()
 
-    # Import from env file
-    env_parser = import_subparsers.add_parser("env", help="Import from .env file")
+    # Export command
+    export_parser = cli_parser.add_parser(
+        "migrate-export", help="Export secrets to various formats"
+    )
+    export_subparsers = LazySubparsers(
+        export_parser.add_subparsers(dest="export_format", help="Export format"),
+        "migrate-export",
+        argv,
+    )
+
+    # Only the invoked export format parser is built
+    export_subparsers.add_parser(
+        "env", _build_export_env_parser, help="Export to .env format"
+    )
+    export_subparsers.add_parser(
+        "docker-compose", _build_export_compose_parser, help="Export to docker-compose env format"
+    )
+    export_subparsers.materialize()
+
+
+def _build_import_env_parser(env_parser) -> None:
+    """Add import env arguments."""
     env_parser.add_argument("file", help="Path to .env file")
     env_parser.add_argument(
         "--namespace", "-n", help="Target namespace (default: shared)"
     )
+    env_parser.set_defaults(func=_handle_env_import)
 
-    # Smart migration from docker-compose
-    smart_parser = import_subparsers.add_parser(
-        "smart", help="Smart migration with secret detection"
-    )
+
+def _build_import_smart_parser(smart_parser) -> None:
+    """Add import smart arguments."""
     smart_parser.add_argument("file", help="Path to docker-compose.yml file")
     smart_parser.add_argument(
         "--namespace", "-n", help="Target namespace (default: shared)"
@@ -822,92 +1049,93 @@ def register_migrate_commands(cli_parser):
         "--auto-import", action="store_true",
         help="Automatically run import after migration"
     )
+    smart_parser.set_defaults(func=_handle_smart_import)
 
-    # Export command
-    export_parser = cli_parser.add_parser(
-        "migrate-export", help="Export secrets to various formats"
-    )
-    export_subparsers = export_parser.add_subparsers(
-        dest="export_format", help="Export format"
-    )
 
-    # Export command
-    migrate_export_parser = export_subparsers.add_parser(
-        "env", help="Export to .env format"
-    )
-    migrate_export_parser.add_argument(
+def _build_export_parser(export_parser) -> None:
+    """Add migrate-export arguments, shared by every export format."""
+    export_parser.add_argument(
         "--namespace", "-n", help="Source namespace (default: current)"
     )
-    migrate_export_parser.add_argument(
+    export_parser.add_argument(
         "--output", "-o", help="Output file (default: stdout)"
     )
 
-    # Export to docker-compose env
-    migrate_compose_export_parser = export_subparsers.add_parser(
-        "docker-compose", help="Export to docker-compose env format"
-    )
-    migrate_compose_export_parser.add_argument(
-        "--namespace", "-n", help="Source namespace (default: current)"
-    )
-    migrate_compose_export_parser.add_argument(
-        "--output", "-o", help="Output file (default: stdout)"
-    )
 
+def _build_export_env_parser(env_parser) -> None:
+    """Add migrate-export env arguments."""
+    _build_export_parser(env_parser)
+    env_parser.set_defaults(func=_handle_env_export)
 
-def handle_migrate_command(args, config: VaultRunnerConfig, vault_client: VaultClient):
-    """Handle migration command execution."""
-    migration_service = MigrationService(config, vault_client)
-
-    if hasattr(args, "import_source"):
-        # Import commands
-        if args.import_source == "env":
-            result = migration_service.migrate_from_env_file(args.file, args.namespace)
-            print(f"Migration completed: {result['success_count']} secrets imported")
-            if result["error_count"] > 0:
-                print(f"Errors: {result['error_count']}")
-                for error in result["errors"]:
-                    print(f"  - {error}")
-
-        elif args.import_source == "docker-compose":
-            result = migration_service.migrate_from_docker_compose(
-                args.file, args.namespace
-            )
-            print(f"Migration completed: {result['success_count']} secrets imported")
-            if result["error_count"] > 0:
-                print(f"Errors: {result['error_count']}")
-                for error in result["errors"]:
-                    print(f"  - {error}")
-
-        elif args.import_source == "smart":
-            # Only one import mode should run
-            auto_migrate = getattr(args, "auto", False) or getattr(args, "no_interactive", False)
-            interactive = not auto_migrate
-            auto_import = getattr(args, "auto_import", False)
-
-            result = migration_service.smart_migrate_docker_compose(
-                args.file, args.namespace, auto_migrate, interactive, auto_import
-            )
-            print("Smart migration completed:")
-            print(f"  Detected secrets: {result['detected']}")
-            print(f"  Migrated: {result['migrated']}")
-            print(f"  Skipped: {result['skipped']}")
-            if result.get("updated_file"):
-                print(f"  Updated file: {result['updated_file']}")
-            if result.get("imported"):
-                print(f"  Import result: {result['imported']}")
-
-    elif hasattr(args, "export_format"):
-        # Export commands
-        if args.export_format == "env":
-            content = migration_service.export_to_env_format(
-                args.namespace, args.output
-            )
-            if not args.output:
-                print(content)
 
-        elif args.export_format == "docker-compose":
-            content = migration_service.export_to_docker_compose_env(
-                args.namespace, args.output
-            )
-            if not args.output:
-                print(content)
+def _build_export_compose_parser(compose_parser) -> None:
+    """Add migrate-export docker-compose arguments."""
+    _build_export_parser(compose_parser)
+    compose_parser.set_defaults(func=_handle_compose_export)
+
+
+def handle_migrate_command(args, config: VaultRunnerConfig, vault_client: "VaultClient"):
+    """Handle migration command execution."""
+    # Each import source and export format parser sets its handler
+    handler = getattr(args, "func", None)
+    if handler is None:
+        logger.error("No migration source or format specified")
+        return
+
+    handler(args, MigrationService(config, vault_client))
+
+
+def _print_import_result(result: Dict[str, Any]) -> None:
+    """Print the summary of a file import."""
+    print(f"Migration completed: {result['success_count']} secrets imported")
+    if result["error_count"] > 0:
+        print(f"Errors: {result['error_count']}")
+        for error in result["errors"]:
+            print(f"  - {error}")
+
+
+def _handle_env_import(args, migration_service: MigrationService) -> None:
+    """Import secrets from a .env file."""
+    result = migration_service.migrate_from_env_file(args.file, args.namespace)
+    _print_import_result(result)
+
+
+def _handle_smart_import(args, migration_service: MigrationService) -> None:
+    """Detect and migrate secrets from a docker-compose file."""
+    # Only one import mode should run
+    auto_migrate = args.auto or args.no_interactive
+    interactive = not auto_migrate
+
+    result = {}
+    for event in migration_service.iter_smart_migrate(
+        args.file, args.namespace, auto_migrate, interactive, args.auto_import
+    ):
+        if isinstance(event, MigratedEvent):
+            if event.success:
+                print(f"  Migrated {event.secret_key} -> {event.vault_path}")
+            else:
+                print(f"  Failed to migrate {event.secret_key}")
+        elif isinstance(event, CompletedEvent):
+            result = event.summary
+    print("Smart migration completed:")
+    print(f"  Detected secrets: {result['detected']}")
+    print(f"  Migrated: {result['migrated']}")
+    print(f"  Skipped: {result['skipped']}")
+    if result.get("updated_file"):
+        print(f"  Updated file: {result['updated_file']}")
+    if result.get("imported"):
+        print(f"  Import result: {result['imported']}")
+
+
+def _handle_env_export(args, migration_service: MigrationService) -> None:
+    """Export secrets in .env format."""
+    content = migration_service.export_to_env_format(args.namespace, args.output)
+    if not args.output:
+        print(content)
+
+
+def _handle_compose_export(args, migration_service: MigrationService) -> None:
+    """Export secrets in docker-compose env format."""
+    content = migration_service.export_to_docker_compose_env(args.namespace, args.output)
+    if not args.output:
+        print(content)
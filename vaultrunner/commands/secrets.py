@@ -5,18 +5,25 @@ Handles all secret management operations with Vault.
 Implements security-first secret handling.
 """
 
+import getpass
 from argparse import ArgumentParser, Namespace
-from typing import Any
+from functools import cached_property
+from typing import Any, List, Optional, Tuple
 
 from ..models.config import VaultRunnerConfig
+from ..utils.lazy_parser import LazySubparsers
+from ..utils.terminal import terminal_available
 from ..utils.logging import get_logger
-from ..vault.client import VaultClient
-from ..security.input_validation import validate_secret_name, validate_secret_content
+from ..security.input_validation import (
+    ValidationError,
+    validate_secret_name,
+    validate_secret_content,
+)
 
 logger = get_logger(__name__)
 
 
-def register_secrets_parser(subparsers: Any) -> None:
+def register_secrets_parser(subparsers: Any, argv: Optional[List[str]] = None) -> None:
     """Register secrets subcommand parser."""
     parser = subparsers.add_parser(
         "secrets",
@@ -24,12 +31,22 @@ def register_secrets_parser(subparsers: Any) -> None:
         description="Add, retrieve, list, and delete secrets in Vault",
     )
 
-    secrets_subparsers = parser.add_subparsers(
-        dest="secrets_command", help="Secrets operations"
+    secrets_subparsers = LazySubparsers(
+        parser.add_subparsers(dest="secrets_command", help="Secrets operations"),
+        "secrets",
+        argv,
     )
 
-    # Add secret command
-    add_parser = secrets_subparsers.add_parser("add", help="Add or update a secret")
+    # Only the invoked subcommand parser is built
+    secrets_subparsers.add_parser("add", _build_add_parser, help="Add or update a secret")
+    secrets_subparsers.add_parser("get", _build_get_parser, help="Retrieve a secret value")
+    secrets_subparsers.add_parser("list", _build_list_parser, help="List secrets")
+    secrets_subparsers.add_parser("delete", _build_delete_parser, help="Delete a secret")
+    secrets_subparsers.materialize()
+
+
+def _build_add_parser(add_parser: ArgumentParser) -> None:
+    """Add secrets add arguments."""
     add_parser.add_argument("path", help="Secret path")
     add_parser.add_argument(
         "value", nargs="?", help="Secret value (prompt if not provided)"
@@ -39,24 +56,27 @@ def register_secrets_parser(subparsers: Any) -> None:
     )
     add_parser.add_argument("--vault-addr", help="Override Vault server address")
 
-    # Get secret command
-    get_parser = secrets_subparsers.add_parser("get", help="Retrieve a secret value")
+
+def _build_get_parser(get_parser: ArgumentParser) -> None:
+    """Add secrets get arguments."""
     get_parser.add_argument("path", help="Secret path")
     get_parser.add_argument(
         "--namespace", "-n", help="Secret namespace (default: shared)"
     )
     get_parser.add_argument("--vault-addr", help="Override Vault server address")
 
-    # List secrets command
-    list_parser = secrets_subparsers.add_parser("list", help="List secrets")
+
+def _build_list_parser(list_parser: ArgumentParser) -> None:
+    """Add secrets list arguments."""
     list_parser.add_argument("path", nargs="?", help="Secret path prefix")
     list_parser.add_argument(
         "--namespace", "-n", help="Secret namespace (default: shared)"
     )
     list_parser.add_argument("--vault-addr", help="Override Vault server address")
 
-    # Delete secret command
-    delete_parser = secrets_subparsers.add_parser("delete", help="Delete a secret")
+
+def _build_delete_parser(delete_parser: ArgumentParser) -> None:
+    """Add secrets delete arguments."""
     delete_parser.add_argument("path", help="Secret path")
     delete_parser.add_argument(
         "--namespace", "-n", help="Secret namespace (default: shared)"
@@ -73,27 +93,57 @@ class SecretsCommand:
     def __init__(self, config: VaultRunnerConfig):
         """Initialize secrets command."""
         self.config = config
-        self.vault_client = VaultClient(config)
+
+    @cached_property
+    def vault_client(self) -> Any:
+        """Vault client, created on first use so help and dry runs never touch Vault."""
+        from ..vault._client_cache import get_cached_vault_client
+
+        return get_cached_vault_client(self.config)
+
+    @cached_property
+    def _default_namespace(self) -> str:
+        """Namespace from configuration, used when --namespace is not given."""
+        return self.config.get_effective_namespace()
+
+    def _resolve_secret_path(self, args: Namespace) -> Tuple[str, str]:
+        """Get the namespace and the namespaced secret path for a command."""
+        namespace = getattr(args, "namespace", None) or self._default_namespace
+        return namespace, namespace + "/" + (args.path or "")
 
     def execute(self, args: Namespace) -> int:
         """Execute secrets command."""
-        try:
-            if args.secrets_command == "add":
-                return self._add_secret(args)
-            elif args.secrets_command == "get":
-                return self._get_secret(args)
-            elif args.secrets_command == "list":
-                return self._list_secrets(args)
-            elif args.secrets_command == "delete":
-                return self._delete_secret(args)
-            else:
-                logger.error("No secrets subcommand specified")
-                return 1
+        handler = {
+            "add": self._add_secret,
+            "get": self._get_secret,
+            "list": self._list_secrets,
+            "delete": self._delete_secret,
+        }.get(args.secrets_command)
+        if self.config.dry_run and args.secrets_command in ("add", "delete"):
+            # Dry runs never prompt for values or reach Vault
+            handler = self._dry_run
+        if handler is None:
+            logger.error("No secrets subcommand specified")
+            return 1
 
-        except Exception as e:
-            logger.error(f"Secrets command failed: {e}")
+        try:
+            return handler(args)
+        except (ValidationError, ValueError, RuntimeError, OSError) as e:
+            logger.error("Secrets command failed: %s", e)
             return 1
 
+    def _dry_run(self, args: Namespace) -> int:
+        """Report what a modifying command would do without running it."""
+        validate_secret_name(args.path)
+        namespace, _ = self._resolve_secret_path(args)
+        logger.info(
+            "[DRY RUN] Would %s secret: %s in namespace %s",
+            args.secrets_command,
+            args.path,
+            namespace,
+        )
+        return 0
+
     def _add_secret(self, args: Namespace) -> int:
         """Add or update a secret."""
         # Validate secret path
@@ -102,8 +152,10 @@ class SecretsCommand:
         # Get secret value
         secret_value = args.value
         if not secret_value:
-            import getpass
-
+            if not terminal_available():
+                raise ValueError(
+                    f"No value given for '{args.path}' and no terminal to prompt on"
+                )
             secret_value = getpass.getpass(f"Enter secret value for '{args.path}': ")
 
         # Validate secret content
@@ -114,18 +166,9 @@ class SecretsCommand:
             self.config.vault_addr = args.vault_addr
 
         # Construct secret path with namespace
-        namespace = (
-            getattr(args, "namespace", None) or self.config.get_effective_namespace()
-        )
-        secret_path = f"{namespace}/{args.path}"
+        namespace, secret_path = self._resolve_secret_path(args)
 
         # Add secret
-        if self.config.dry_run:
-            logger.info(
-                "[DRY RUN] Would add secret: %s in namespace %s", args.path, namespace
-            )
-            return 0
-
         success = self.vault_client.put_secret(secret_path, secret_value)
         if success:
             logger.info(
@@ -146,10 +189,7 @@ class SecretsCommand:
             self.config.vault_addr = args.vault_addr
 
         # Construct secret path with namespace
-        namespace = (
-            getattr(args, "namespace", None) or self.config.get_effective_namespace()
-        )
-        secret_path = f"{namespace}/{args.path}"
+        namespace, secret_path = self._resolve_secret_path(args)
 
         # Get secret
         secret_value = self.vault_client.get_secret(secret_path)
@@ -174,12 +214,12 @@ class SecretsCommand:
         if args.vault_addr:
             self.config.vault_addr = args.vault_addr
 
-        # List secrets
-        secrets = self.vault_client.list_secrets(args.path)
+        # List secrets under the namespace
+        _, secret_path = self._resolve_secret_path(args)
+        secrets = self.vault_client.list_secrets(secret_path)
         if secrets is not None:
             if secrets:
-                for secret in secrets:
-                    print(secret)
+                print("\n".join(secrets))
             else:
                 logger.info("No secrets found")
             return 0
@@ -193,7 +233,7 @@ class SecretsCommand:
         validate_secret_name(args.path)
 
         # Confirm deletion unless force is used
-        if not args.force and not self.config.dry_run:
+        if not args.force:
             response = input(f"Delete secret '{args.path}'? (y/N): ")
             if response.lower() != "y":
                 logger.info("Deletion cancelled")
@@ -204,14 +244,11 @@ class SecretsCommand:
             self.config.vault_addr = args.vault_addr
 
         # Delete secret
-        if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would delete secret: {args.path}")
-            return 0
-
-        success = self.vault_client.delete_secret(args.path)
+        _, secret_path = self._resolve_secret_path(args)
+        success = self.vault_client.delete_secret(secret_path)
         if success:
-            logger.info(f"Secret deleted successfully: {args.path}")
+            logger.info("Secret deleted successfully: %s", args.path)
             return 0
         else:
-            logger.error(f"Failed to delete secret: {args.path}")
+            logger.error("Failed to delete secret: %s", args.path)
             return 1
@@ -5,28 +5,62 @@ Provides secure vault initialization, key management, and export functionality.
 """
 
 import getpass
+from functools import cached_property
+from typing import Any, List, Optional
+from ..utils.lazy_parser import LazySubparsers
+from ..utils.terminal import terminal_available
 from ..utils.logging import get_logger
-from ..security.key_manager import SecureKeyManager
 from ..models.config import VaultRunnerConfig
 
 logger = get_logger(__name__)
 
+# Usage shown when no secure subcommand is given
+_USAGE = """Secure vault commands:
+  init           - Initialize secure vault with encrypted keys
+  export         - Export vault key after password verification
+  change-password - Change the password for vault key encryption"""
 
-def register_secure_commands(cli_parser):
+# Summary printed after a successful init; the key hint line is filled in per run
+_INIT_TEMPLATE = """🔐 Secure Vault initialized successfully!
+📄 SSL Certificate: %s
+🔑 SSL Private Key: %s
+%s
+
+Next steps:
+1. Start Vault with: vaultrunner vault deploy --dev
+2. Set VAULT_TOKEN environment variable
+3. Use VaultRunner commands as usual"""
+
+
+def register_secure_commands(cli_parser, argv: Optional[List[str]] = None):
     """Register secure vault commands with the CLI parser."""
 
     # Secure vault command
     secure_parser = cli_parser.add_parser(
         "secure", help="Secure vault key management and initialization"
     )
-    secure_subparsers = secure_parser.add_subparsers(
-        dest="secure_command", help="Secure vault commands"
+    secure_subparsers = LazySubparsers(
+        secure_parser.add_subparsers(dest="secure_command", help="Secure vault commands"),
+        "secure",
+        argv,
     )
 
-    # Initialize secure vault
-    init_parser = secure_subparsers.add_parser(
-        "init", help="Initialize secure vault with encrypted keys"
+    # Only the invoked subcommand parser is built
+    secure_subparsers.add_parser(
+        "init", _build_init_parser, help="Initialize secure vault with encrypted keys"
+    )
+    secure_subparsers.add_parser(
+        "export", _build_export_parser, help="Export vault key after password verification"
     )
+    secure_subparsers.add_parser(
+        "change-password", _build_change_password_parser,
+        help="Change the password for vault key encryption"
+    )
+    secure_subparsers.materialize()
+
+
+def _build_init_parser(init_parser) -> None:
+    """Add secure init arguments."""
     init_parser.add_argument(
         "--password", help="Password for key encryption (prompt if not provided)"
     )
@@ -35,18 +69,16 @@ def register_secure_commands(cli_parser):
         help="Export the generated vault key to stdout"
     )
 
-    # Export vault key
-    export_parser = secure_subparsers.add_parser(
-        "export", help="Export vault key after password verification"
-    )
+
+def _build_export_parser(export_parser) -> None:
+    """Add secure export arguments."""
     export_parser.add_argument(
         "--password", help="Password for key decryption (prompt if not provided)"
     )
 
-    # Change password
-    change_parser = secure_subparsers.add_parser(
-        "change-password", help="Change the password for vault key encryption"
-    )
+
+def _build_change_password_parser(change_parser) -> None:
+    """Add secure change-password arguments."""
     change_parser.add_argument(
         "--old-password", help="Current password (prompt if not provided)"
     )
@@ -60,7 +92,13 @@ class SecureVaultCommand:
 
     def __init__(self, config: VaultRunnerConfig):
         self.config = config
-        self.key_manager = SecureKeyManager(config.vault_dir)
+
+    @cached_property
+    def key_manager(self) -> Any:
+        """Key manager, created on first use so the crypto stack loads only when needed."""
+        from ..security.key_manager import SecureKeyManager
+
+        return SecureKeyManager(self.config.vault_dir)
 
     def execute(self, args):
         """Execute secure vault command."""
@@ -73,10 +111,7 @@ class SecureVaultCommand:
         elif command == "change-password":
             return self._change_password(args)
         else:
-            print("Secure vault commands:")
-            print("  init           - Initialize secure vault with encrypted keys")
-            print("  export         - Export vault key after password verification")
-            print("  change-password - Change the password for vault key encryption")
+            print(_USAGE)
             return 0
 
     def _init_secure_vault(self, args) -> int:
@@ -94,20 +129,15 @@ class SecureVaultCommand:
             # Initialize secure vault
             result = self.key_manager.initialize_secure_vault(password)
 
-            print("🔐 Secure Vault initialized successfully!")
-            print(f"📄 SSL Certificate: {result['ssl_certificate']}")
-            print(f"🔑 SSL Private Key: {result['ssl_private_key']}")
-
             if args.export_key:
-                print(f"🗝️  Vault Root Key: {result['vault_key']}")
-                print("⚠️  WARNING: Store this key securely! It will not be shown again.")
+                key_hint = (
+                    f"🗝️  Vault Root Key: {result['vault_key']}\n"
+                    "⚠️  WARNING: Store this key securely! It will not be shown again."
+                )
             else:
-                print("💡 Use 'vaultrunner secure export' to retrieve the vault key later")
+                key_hint = "💡 Use 'vaultrunner secure export' to retrieve the vault key later"
 
-            print("\nNext steps:")
-            print("1. Start Vault with: vaultrunner vault deploy --dev")
-            print("2. Set VAULT_TOKEN environment variable")
-            print("3. Use VaultRunner commands as usual")
+            print(_INIT_TEMPLATE % (result["ssl_certificate"], result["ssl_private_key"], key_hint))
 
             return 0
 
@@ -127,8 +157,8 @@ class SecureVaultCommand:
             vault_key = self.key_manager.export_vault_key(password)
 
             if vault_key:
-                print(f"🗝️  Vault Root Key: {vault_key}")
-                print("⚠️  WARNING: Keep this key secure!")
+                print(f"🗝️  Vault Root Key: {vault_key}\n"
+                      "⚠️  WARNING: Keep this key secure!")
                 return 0
             else:
                 print("❌ Failed to decrypt vault key. Incorrect password?")
@@ -180,4 +210,8 @@ class SecureVaultCommand:
 
     def _prompt_password(self, prompt: str) -> str:
         """Prompt user for password securely."""
+        if not terminal_available():
+            raise ValueError(
+                f"Cannot prompt for '{prompt}' without a terminal; pass the password as an option"
+            )
         return getpass.getpass(f"{prompt}: ")
\ No newline at end of file
@@ -13,10 +13,156 @@ from typing import Dict, List, Any
 
 from ..models.config import VaultRunnerConfig
 from ..utils.logging import get_logger
-from ..vault.client import VaultClient
+from ..vault._client_cache import get_cached_vault_client
 
 logger = get_logger(__name__)
 
+# Example templates installed by "templates install", keyed by template name
+_EXAMPLE_TEMPLATES: Dict[str, str] = {
+    "docker-compose-env": """# Docker Compose Environment Template
+# Generated by VaultRunner - pulls secrets from Vault for docker-compose
+# Usage: vaultrunner templates generate docker-compose --namespace myapp > docker-compose.override.yml
+
+version: '3.8'
+services:
+  app:
+    environment:
+      # Database Configuration
+      - DATABASE_URL=$$VAULT_SECRET:{{namespace}}/database/url
+      - DB_HOST=$$VAULT_SECRET:{{namespace}}/database/host
+      - DB_PORT=$$VAULT_SECRET:{{namespace}}/database/port
+      - DB_NAME=$$VAULT_SECRET:{{namespace}}/database/name
+      - DB_USER=$$VAULT_SECRET:{{namespace}}/database/user
+      - DB_PASSWORD=$$VAULT_SECRET:{{namespace}}/database/password
+      
+      # API Configuration
+      - API_KEY=$$VAULT_SECRET:{{namespace}}/api/key
+      - JWT_SECRET=$$VAULT_SECRET:{{namespace}}/api/jwt_secret
+      - EXTERNAL_API_TOKEN=$$VAULT_SECRET:{{namespace}}/api/external_token
+      
+      # Application Settings
+      - APP_ENV={{namespace}}
+      - LOG_LEVEL=info
+""",
+    "kubernetes-secrets": """# Kubernetes Secrets Template
+# Generated by VaultRunner - creates K8s secrets from Vault
+apiVersion: v1
+kind: Secret
+metadata:
+  name: app-secrets
+  namespace: {{namespace}}
+type: Opaque
+data:
+  # Database secrets (base64 encoded)
+  db-host: $$VAULT_SECRET_B64:{{namespace}}/database/host
+  db-password: $$VAULT_SECRET_B64:{{namespace}}/database/password
+  db-user: $$VAULT_SECRET_B64:{{namespace}}/database/user
+  
+  # API secrets
+  api-key: $$VAULT_SECRET_B64:{{namespace}}/api/key
+  jwt-secret: $$VAULT_SECRET_B64:{{namespace}}/api/jwt_secret
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: app
+spec:
+  template:
+    spec:
+      containers:
+      - name: app
+        envFrom:
+        - secretRef:
+            name: app-secrets
+""",
+    "env-file": """# Environment File Template
+# Generated by VaultRunner - exports secrets as environment variables
+# Usage: source <(vaultrunner templates generate env --namespace myapp)
+
+# Database Configuration
+export DATABASE_URL="$$VAULT_SECRET:{{namespace}}/database/url"
+export DB_HOST="$$VAULT_SECRET:{{namespace}}/database/host"
+export DB_PORT="$$VAULT_SECRET:{{namespace}}/database/port"
+export DB_NAME="$$VAULT_SECRET:{{namespace}}/database/name"
+export DB_USER="$$VAULT_SECRET:{{namespace}}/database/user"
+export DB_PASSWORD="$$VAULT_SECRET:{{namespace}}/database/password"
+
+# API Configuration
+export API_KEY="$$VAULT_SECRET:{{namespace}}/api/key"
+export JWT_SECRET="$$VAULT_SECRET:{{namespace}}/api/jwt_secret"
+export EXTERNAL_API_TOKEN="$$VAULT_SECRET:{{namespace}}/api/external_token"
+
+# Application Settings
+export APP_ENV="{{namespace}}"
+export LOG_LEVEL="info"
+""",
+    "deployment-script": """#!/bin/bash
+# Deployment Script Template
+# Generated by VaultRunner - deploys with secrets from Vault
+
+set -euo pipefail
+
+NAMESPACE="{{namespace}}"
+VAULT_ADDR="${VAULT_ADDR:-http://localhost:8200}"
+
+echo "🚀 Starting deployment for namespace: $NAMESPACE"
+
+# Fetch secrets from Vault
+echo "📦 Retrieving secrets from Vault..."
+DB_PASSWORD=$(vaultrunner secrets get database/password --namespace "$NAMESPACE")
+API_KEY=$(vaultrunner secrets get api/key --namespace "$NAMESPACE")
+
+# Export as environment variables
+export DB_PASSWORD
+export API_KEY
+export APP_ENV="$NAMESPACE"
+
+# Deploy application
+echo "🔧 Deploying application..."
+if [ -f "docker-compose.yml" ]; then
+    docker-compose up -d
+elif [ -f "deployment.yaml" ]; then
+    kubectl apply -f deployment.yaml
+else
+    echo "❌ No deployment configuration found"
+    exit 1
+fi
+
+echo "✅ Deployment completed successfully!"
+""",
+    "backup-script": """#!/bin/bash
+# Vault Backup Script Template  
+# Generated by VaultRunner - backs up namespace secrets
+
+set -euo pipefail
+
+NAMESPACE="${1:-{{namespace}}}"
+BACKUP_DIR="./backups"
+TIMESTAMP=$(date +"%Y%m%d_%H%M%S")
+BACKUP_FILE="$BACKUP_DIR/vault_backup_${NAMESPACE}_${TIMESTAMP}.json"
+
+echo "💾 Creating backup for namespace: $NAMESPACE"
+
+# Create backup directory
+mkdir -p "$BACKUP_DIR"
+
+# Get all secrets from namespace
+echo "📥 Exporting secrets..."
+vaultrunner bulk-get $(vaultrunner namespace secrets --namespace "$NAMESPACE" | tail -n +2 | sed 's/^  - //') \
+    --namespace "$NAMESPACE" \
+    --format json > "$BACKUP_FILE"
+
+echo "✅ Backup saved to: $BACKUP_FILE"
+echo "📊 Backup size: $(du -h "$BACKUP_FILE" | cut -f1)"
+
+# Optional: compress backup
+if command -v gzip &> /dev/null; then
+    gzip "$BACKUP_FILE"
+    echo "🗜️ Backup compressed: ${BACKUP_FILE}.gz"
+fi
+""",
+}
+
 
 def register_templates_parser(subparsers):
     """Register templates subcommand parser."""
@@ -67,7 +213,7 @@ class TemplatesCommand:
 
     def __init__(self, config: VaultRunnerConfig):
         self.config = config
-        self.vault_client = VaultClient(config)
+        self.vault_client = get_cached_vault_client(config)
         self.templates_dir = Path(config.vault_dir) / "templates"
 
     def execute(self, args: Namespace) -> int:
@@ -123,10 +269,9 @@ class TemplatesCommand:
         # Create templates directory
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
-        templates = self._get_example_templates()
         installed_count = 0
 
-        for template_name, template_content in templates.items():
+        for template_name, template_content in _EXAMPLE_TEMPLATES.items():
             template_file = self.templates_dir / f"{template_name}.template"
 
             if template_file.exists() and not args.force:
@@ -196,153 +341,6 @@ class TemplatesCommand:
             logger.error("Failed to read template: %s", str(e))
             return 1
 
-    def _get_example_templates(self) -> Dict[str, str]:
-        """Get example templates to install."""
-        return {
-            "docker-compose-env": """# Docker Compose Environment Template
-# Generated by VaultRunner - pulls secrets from Vault for docker-compose
-# Usage: vaultrunner templates generate docker-compose --namespace myapp > docker-compose.override.yml
-
-version: '3.8'
-services:
-  app:
-    environment:
-      # Database Configuration
-      - DATABASE_URL=$$VAULT_SECRET:{{namespace}}/database/url
-      - DB_HOST=$$VAULT_SECRET:{{namespace}}/database/host
-      - DB_PORT=$$VAULT_SECRET:{{namespace}}/database/port
-      - DB_NAME=$$VAULT_SECRET:{{namespace}}/database/name
-      - DB_USER=$$VAULT_SECRET:{{namespace}}/database/user
-      - DB_PASSWORD=$$VAULT_SECRET:{{namespace}}/database/password
-      
-      # API Configuration
-      - API_KEY=$$VAULT_SECRET:{{namespace}}/api/key
-      - JWT_SECRET=$$VAULT_SECRET:{{namespace}}/api/jwt_secret
-      - EXTERNAL_API_TOKEN=$$VAULT_SECRET:{{namespace}}/api/external_token
-      
-      # Application Settings
-      - APP_ENV={{namespace}}
-      - LOG_LEVEL=info
-""",
-            "kubernetes-secrets": """# Kubernetes Secrets Template
-# Generated by VaultRunner - creates K8s secrets from Vault
-apiVersion: v1
-kind: Secret
-metadata:
-  name: app-secrets
-  namespace: {{namespace}}
-type: Opaque
-data:
-  # Database secrets (base64 encoded)
-  db-host: $$VAULT_SECRET_B64:{{namespace}}/database/host
-  db-password: $$VAULT_SECRET_B64:{{namespace}}/database/password
-  db-user: $$VAULT_SECRET_B64:{{namespace}}/database/user
-  
-  # API secrets
-  api-key: $$VAULT_SECRET_B64:{{namespace}}/api/key
-  jwt-secret: $$VAULT_SECRET_B64:{{namespace}}/api/jwt_secret
----
-apiVersion: apps/v1
-kind: Deployment
-metadata:
-  name: app
-spec:
-  template:
-    spec:
-      containers:
-      - name: app
-        envFrom:
-        - secretRef:
-            name: app-secrets
-""",
-            "env-file": """# Environment File Template
-# Generated by VaultRunner - exports secrets as environment variables
-# Usage: source <(vaultrunner templates generate env --namespace myapp)
-
-# Database Configuration
-export DATABASE_URL="$$VAULT_SECRET:{{namespace}}/database/url"
-export DB_HOST="$$VAULT_SECRET:{{namespace}}/database/host"
-export DB_PORT="$$VAULT_SECRET:{{namespace}}/database/port"
-export DB_NAME="$$VAULT_SECRET:{{namespace}}/database/name"
-export DB_USER="$$VAULT_SECRET:{{namespace}}/database/user"
-export DB_PASSWORD="$$VAULT_SECRET:{{namespace}}/database/password"
-
-# API Configuration
-export API_KEY="$$VAULT_SECRET:{{namespace}}/api/key"
-export JWT_SECRET="$$VAULT_SECRET:{{namespace}}/api/jwt_secret"
-export EXTERNAL_API_TOKEN="$$VAULT_SECRET:{{namespace}}/api/external_token"
-
-# Application Settings
-export APP_ENV="{{namespace}}"
-export LOG_LEVEL="info"
-""",
-            "deployment-script": """#!/bin/bash
-# Deployment Script Template
-# Generated by VaultRunner - deploys with secrets from Vault
-
-set -euo pipefail
-
-NAMESPACE="{{namespace}}"
-VAULT_ADDR="${VAULT_ADDR:-http://localhost:8200}"
-
-echo "🚀 Starting deployment for namespace: $NAMESPACE"
-
-# Fetch secrets from Vault
-echo "📦 Retrieving secrets from Vault..."
-DB_PASSWORD=$(vaultrunner secrets get database/password --namespace "$NAMESPACE")
-API_KEY=$(vaultrunner secrets get api/key --namespace "$NAMESPACE")
-
-# Export as environment variables
-export DB_PASSWORD
-export API_KEY
-export APP_ENV="$NAMESPACE"
-
-# Deploy application
-echo "🔧 Deploying application..."
-if [ -f "docker-compose.yml" ]; then
-    docker-compose up -d
-elif [ -f "deployment.yaml" ]; then
-    kubectl apply -f deployment.yaml
-else
-    echo "❌ No deployment configuration found"
-    exit 1
-fi
-
-echo "✅ Deployment completed successfully!"
-""",
-            "backup-script": """#!/bin/bash
-# Vault Backup Script Template  
-# Generated by VaultRunner - backs up namespace secrets
-
-set -euo pipefail
-
-NAMESPACE="${1:-{{namespace}}}"
-BACKUP_DIR="./backups"
-TIMESTAMP=$(date +"%Y%m%d_%H%M%S")
-BACKUP_FILE="$BACKUP_DIR/vault_backup_${NAMESPACE}_${TIMESTAMP}.json"
-
-echo "💾 Creating backup for namespace: $NAMESPACE"
-
-# Create backup directory
-mkdir -p "$BACKUP_DIR"
-
-# Get all secrets from namespace
-echo "📥 Exporting secrets..."
-vaultrunner bulk-get $(vaultrunner namespace secrets --namespace "$NAMESPACE" | tail -n +2 | sed 's/^  - //') \
-    --namespace "$NAMESPACE" \
-    --format json > "$BACKUP_FILE"
-
-echo "✅ Backup saved to: $BACKUP_FILE"
-echo "📊 Backup size: $(du -h "$BACKUP_FILE" | cut -f1)"
-
-# Optional: compress backup
-if command -v gzip &> /dev/null; then
-    gzip "$BACKUP_FILE"
-    echo "🗜️ Backup compressed: ${BACKUP_FILE}.gz"
-fi
-""",
-        }
-
     def _generate_docker_compose_template(self, namespace: str) -> str:
         """Generate docker-compose template with current secrets."""
         try:
@@ -5,8 +5,10 @@ Handles command line parsing and routing to appropriate modules.
 Implements security-first design with input validation.
 """
 
+import os
 import sys
 import argparse
+from functools import lru_cache
 from typing import List, Optional
 
 from ..core.init import VaultRunnerApp
@@ -15,9 +17,20 @@ from ..security.input_validation import validate_args
 
 logger = get_logger(__name__)
 
+# argparse translates the same few messages for every parser it builds, and
+# each gettext call searches for catalogs again; the strings are fixed, so
+# translate each one once per process
+argparse._ = lru_cache(maxsize=None)(argparse._)
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser with all subcommands."""
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Create the main argument parser with all subcommands.
+
+    Args:
+        argv: Arguments that will be parsed, used to build only the
+            subcommand parsers being invoked (default: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         prog="vaultrunner",
         description="HashiCorp Vault Docker Integration Tool",
@@ -28,7 +41,6 @@ Examples:
   vaultrunner templates create myapp/database/password
   vaultrunner docker upgrade docker-compose.yml
   vaultrunner vault deploy
-  vaultrunner export docker-compose.yml
 
 For more help on a specific command, use:
   vaultrunner <command> --help
@@ -68,7 +80,6 @@ For more help on a specific command, use:
     from ..commands.templates import register_templates_parser
     from ..commands.docker import register_docker_parser
     from ..commands.vault import register_vault_parser
-    from ..commands.export import register_export_parser
     from ..commands.bulk import register_bulk_commands
     from ..commands.deploy import register_deploy_parser
     from ..commands.migrate import register_migrate_commands
@@ -76,15 +87,21 @@ For more help on a specific command, use:
     from ..commands.backup import register_backup_commands
     from ..commands.mcp import register_mcp_parser
 
-    register_secrets_parser(subparsers)
+    register_secrets_parser(subparsers, argv)
     register_templates_parser(subparsers)
-    register_docker_parser(subparsers)
+    register_docker_parser(subparsers, argv)
     register_vault_parser(subparsers)
-    register_export_parser(subparsers)
+
+    # Export is a placeholder, only offered when experimental commands are enabled
+    if os.environ.get("VAULTRUNNER_ENABLE_EXPERIMENTAL"):
+        from ..commands.export import register_export_parser
+
+        register_export_parser(subparsers)
+
     register_bulk_commands(subparsers)
-    register_deploy_parser(subparsers)
-    register_migrate_commands(subparsers)
-    register_secure_commands(subparsers)
+    register_deploy_parser(subparsers, argv)
+    register_migrate_commands(subparsers, argv)
+    register_secure_commands(subparsers, argv)
     register_backup_commands(subparsers)
     register_mcp_parser(subparsers)
 
@@ -99,7 +116,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     args = None
     try:
         # Parse arguments
-        parser = create_parser()
+        parser = create_parser(argv)
         args = parser.parse_args(argv)
 
         # Validate arguments for security
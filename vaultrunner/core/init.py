@@ -27,6 +27,7 @@ class VaultRunnerApp:
         self.args = args
         self.config: VaultRunnerConfig = None
         self.vault_dir = Path(".vault")
+        self._vault_client = None
 
         # Setup logging first
         setup_logging(args.log_level)
@@ -71,6 +72,14 @@ class VaultRunnerApp:
             logger.info(f"Creating vault directory: {self.vault_dir}")
             self.vault_dir.mkdir(mode=0o700, exist_ok=True)
 
+    def get_vault_client(self):
+        """Get the Vault client shared by all command handlers."""
+        if self._vault_client is None:
+            from ..vault._client_cache import get_cached_vault_client
+
+            self._vault_client = get_cached_vault_client(self.config)
+        return self._vault_client
+
     def execute_command(self, args: Namespace) -> int:
         """Execute the specified command."""
         logger.debug(f"Executing command: {args.command}")
@@ -81,13 +90,11 @@ class VaultRunnerApp:
             from ..commands.templates import TemplatesCommand
             from ..commands.docker import DockerCommand
             from ..commands.vault import VaultCommand
-            from ..commands.export import ExportCommand
             from ..commands.deploy import DeployCommand
             from ..commands.secure import SecureVaultCommand
             from ..commands.backup import BackupRestoreCommand
             from ..commands.migrate import handle_migrate_command
             from ..commands.bulk import handle_bulk_command
-            from ..vault.client import VaultClient
 
             # Route to appropriate command
             if args.command == "secrets":
@@ -103,6 +110,7 @@ class VaultRunnerApp:
                 command = VaultCommand(self.config)
                 return command.execute(args)
             elif args.command == "export":
+                from ..commands.export import ExportCommand
                 command = ExportCommand(self.config)
                 return command.execute(args)
             elif args.command == "deploy":
@@ -111,19 +119,17 @@ class VaultRunnerApp:
             elif args.command == "secure":
                 command = SecureVaultCommand(self.config)
                 return command.execute(args)
-            elif args.command == "backup":
-                command = BackupRestoreCommand(self.config)
+            elif args.command in ["backup", "restore", "cron-setup"]:
+                command = BackupRestoreCommand(self.config, self.get_vault_client())
                 return command.execute(args)
             elif args.command == "mcp-server":
                 from ..commands.mcp import run_mcp_server
                 return run_mcp_server(args)
-            elif args.command == "import":
-                vault_client = VaultClient(self.config)
-                handle_migrate_command(args, self.config, vault_client)
+            elif args.command in ["import", "migrate-export"]:
+                handle_migrate_command(args, self.config, self.get_vault_client())
                 return 0
             elif args.command in ["namespace", "bulk-set", "bulk-get"]:
-                vault_client = VaultClient(self.config)
-                handle_bulk_command(args, self.config, vault_client)
+                handle_bulk_command(args, self.config, self.get_vault_client())
                 return 0
             else:
                 logger.error("Unknown command: %s", args.command)
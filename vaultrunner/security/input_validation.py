@@ -7,8 +7,9 @@ Prevents injection attacks and validates all user inputs.
 
 import re
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from argparse import Namespace
 from urllib.parse import urlparse
 
@@ -16,6 +17,15 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Allowed secret name characters: alphanumeric, hyphens, underscores, forward slashes
+_SECRET_NAME_RE = re.compile(r"^[a-zA-Z0-9/_-]+$")
+
+# Content patterns that suggest a pasted credential assignment or SQL statement
+_DANGEROUS_CONTENT_RE = re.compile(
+    r'(password|secret|key|token)\s*=\s*["\']?\s*["\']?'
+    r"|(drop|select|insert|update|delete)\s+"
+)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -25,21 +35,29 @@ class ValidationError(Exception):
 
 def validate_secret_name(secret_name: str) -> None:
     """Validate secret name format for security."""
+    error = _secret_name_error(secret_name)
+    if error is not None:
+        raise ValidationError(error)
+
+
+@lru_cache(maxsize=4096)
+def _secret_name_error(secret_name: str) -> Optional[str]:
+    """Get the validation error for a secret name, or None if it is valid (memoized)."""
     if not secret_name:
-        raise ValidationError("Secret name cannot be empty")
+        return "Secret name cannot be empty"
 
     # Validate format: alphanumeric, hyphens, underscores, forward slashes only
-    if not re.match(r"^[a-zA-Z0-9/_-]+$", secret_name):
-        raise ValidationError(
+    if not _SECRET_NAME_RE.match(secret_name):
+        return (
             f"Invalid secret name format: {secret_name}. "
             "Secret names must contain only alphanumeric characters, hyphens, underscores, and forward slashes"
         )
 
     # Check length limits
     if len(secret_name) > 255:
-        raise ValidationError(
-            f"Secret name too long (max 255 characters): {secret_name}"
-        )
+        return f"Secret name too long (max 255 characters): {secret_name}"
+
+    return None
 
 
 def validate_file_path(file_path: str, context: str = "file") -> None:
@@ -138,20 +156,11 @@ def validate_secret_content(secret_value: str, secret_path: str) -> None:
     if not secret_value:
         raise ValidationError("Secret value cannot be empty")
 
-    # Check for common security issues
-    lower_value = secret_value.lower()
-
     # Check for potential credential patterns
-    dangerous_patterns = [
-        r'(password|secret|key|token)\s*=\s*["\']?\s*["\']?',
-        r"(drop|select|insert|update|delete)\s+",
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, lower_value):
-            logger.warning(
-                f"Secret value contains potentially dangerous patterns: {secret_path}"
-            )
+    if _DANGEROUS_CONTENT_RE.search(secret_value.lower()):
+        logger.warning(
+            "Secret value contains potentially dangerous patterns: %s", secret_path
+        )
 
     # Check minimum length for passwords
     if len(secret_value) < 8:
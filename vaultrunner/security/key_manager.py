@@ -5,17 +5,24 @@ Provides secure storage, encryption, and management of Vault keys and certificat
 Implements password-based encryption with SSL certificate generation.
 """
 
+import os
 import json
+import hmac
 import base64
+import hashlib
 import secrets
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Iterable, Iterator, Tuple, Union
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.backends import default_backend
 from cryptography import x509
+from cryptography.exceptions import InvalidTag
 from cryptography.x509.oid import NameOID
 from datetime import datetime, timedelta
 
@@ -23,12 +30,38 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Process-local secret for key cache digests, so cache entries never hold a
+# password or a password-equivalent hash
+_CACHE_SECRET = secrets.token_bytes(32)
+
 
 class SecureKeyManager:
     """Manages secure storage and encryption of Vault keys and certificates."""
 
-    def __init__(self, vault_dir: Path):
+    # Prefix marking AES-GCM encrypted keys; unprefixed keys are legacy AES-CBC
+    VAULT_KEY_PREFIX = "v2:"
+
+    # PBKDF2-HMAC-SHA256 rounds; encrypted keys and backups do not record the
+    # count, so changing it makes existing data undecryptable
+    KDF_ITERATIONS = 100000
+
+    # Header marking files written by encrypt_stream
+    STREAM_MAGIC = b"VRBK\x01"
+    STREAM_CHUNK_SIZE = 65536
+    GCM_TAG_SIZE = 16
+
+    # Derived keys are cached process-wide so repeated operations with the
+    # same password skip PBKDF2
+    KEY_CACHE_SIZE = 4
+    _key_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+    _salt_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+    _aead_cache: "OrderedDict[bytes, AESGCM]" = OrderedDict()
+    _key_cache_lock = threading.Lock()
+
+    def __init__(self, vault_dir: Path, cache_keys: bool = True):
         self.vault_dir = vault_dir
+        # When False this instance neither reads nor fills the key caches
+        self.cache_keys = cache_keys
         self.keys_dir = vault_dir / "keys"
         self.certs_dir = vault_dir / "certs"
         self.keys_dir.mkdir(parents=True, exist_ok=True)
@@ -105,62 +138,109 @@ class SecureKeyManager:
             "private_key": str(key_path)
         }
 
-    def encrypt_vault_key(self, vault_key: str, password: str) -> str:
-        """
-        Encrypt the Vault root key with password-based encryption.
-
-        Args:
-            vault_key: The Vault root token/key to encrypt
-            password: User password for encryption
-
-        Returns:
-            Encrypted key data as base64 string
-        """
-        logger.info("Encrypting Vault key with password protection")
-
-        # Generate salt
-        salt = secrets.token_bytes(16)
+    def _derive_key(self, password: str, salt: bytes) -> bytes:
+        """Derive a 256-bit encryption key from a password and salt."""
+        digest = self._cache_digest(password, salt)
+        with self._key_cache_lock:
+            key = self._key_cache.get(digest) if self.cache_keys else None
+            if key is not None:
+                self._key_cache.move_to_end(digest)
+                return key
 
-        # Derive key from password
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
             salt=salt,
-            iterations=100000,
+            iterations=self.KDF_ITERATIONS,
             backend=default_backend()
         )
         key = kdf.derive(password.encode())
 
-        # Generate IV
-        iv = secrets.token_bytes(16)
+        self._cache_put(self._key_cache, digest, key)
+        return key
 
-        # Encrypt the vault key
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
+    def _encryption_key(self, password: str) -> Tuple[bytes, bytes]:
+        """
+        Get a (salt, key) pair for encrypting with a password.
+
+        The salt is generated once per password per process and reused with
+        fresh nonces, so only the first encryption pays for key derivation.
+        """
+        digest = self._cache_digest(password, b"")
+        with self._key_cache_lock:
+            salt = self._salt_cache.get(digest) if self.cache_keys else None
 
-        # Pad the data to block size
-        data = vault_key.encode()
-        block_size = 16
-        padding_length = block_size - (len(data) % block_size)
-        padded_data = data + bytes([padding_length]) * padding_length
+        if salt is None:
+            salt = secrets.token_bytes(16)
+            self._cache_put(self._salt_cache, digest, salt)
 
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        return salt, self._derive_key(password, salt)
 
-        # Combine salt, IV, and encrypted data
-        combined = salt + iv + encrypted_data
+    @staticmethod
+    def _cache_digest(password: str, salt: bytes) -> bytes:
+        """Compute the cache lookup key for a password and salt."""
+        return hmac.new(_CACHE_SECRET, salt + password.encode(), hashlib.sha256).digest()
 
-        # Return as base64
-        encrypted_b64 = base64.b64encode(combined).decode()
+    def _aead(self, key: bytes) -> AESGCM:
+        """
+        Get an AES-GCM cipher for a key, reusing one built for the same key.
+
+        An AESGCM object keeps its initialized OpenSSL context and copies it
+        for each operation, so reuse skips the per-call key schedule setup.
+        """
+        digest = hmac.new(_CACHE_SECRET, key, hashlib.sha256).digest()
+        with self._key_cache_lock:
+            aead = self._aead_cache.get(digest) if self.cache_keys else None
+            if aead is not None:
+                self._aead_cache.move_to_end(digest)
+                return aead
+
+        aead = AESGCM(key)
+        self._cache_put(self._aead_cache, digest, aead)
+        return aead
+
+    def _cache_put(self, cache: "OrderedDict[bytes, Any]", digest: bytes, value: Any) -> None:
+        """Store a value in a bounded cache, evicting the oldest entry."""
+        if not self.cache_keys:
+            return
+        with self._key_cache_lock:
+            cache[digest] = value
+            cache.move_to_end(digest)
+            while len(cache) > self.KEY_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def encrypt_vault_key(self, vault_key: str, password: str) -> str:
+        """
+        Encrypt the Vault root key with password-based encryption.
+
+        Args:
+            vault_key: The Vault root token/key to encrypt
+            password: User password for encryption
+
+        Returns:
+            Encrypted key data as a versioned base64 string
+        """
+        logger.info("Encrypting Vault key with password protection")
+
+        # Derive key from password and generate nonce
+        salt, key = self._encryption_key(password)
+        nonce = secrets.token_bytes(12)
+
+        # Encrypt and authenticate the vault key (ciphertext carries the GCM tag)
+        encrypted_data = self._aead(key).encrypt(nonce, vault_key.encode(), None)
+
+        # Return versioned base64 of salt, nonce and encrypted data
+        encrypted_b64 = self.VAULT_KEY_PREFIX + base64.b64encode(salt + nonce + encrypted_data).decode()
 
         logger.info("Vault key encrypted successfully")
         return encrypted_b64
 
-    def decrypt_vault_key(self, encrypted_key: str, password: str) -> str:
+    def decrypt_vault_key(self, encrypted_key: Union[str, bytes], password: str) -> str:
         """
         Decrypt the Vault root key.
 
         Args:
-            encrypted_key: Encrypted key data as base64 string
+            encrypted_key: Encrypted key data as base64 string or ASCII bytes
             password: User password for decryption
 
         Returns:
@@ -168,7 +248,22 @@ class SecureKeyManager:
         """
         logger.info("Decrypting Vault key")
 
-        # Decode from base64
+        prefix = self.VAULT_KEY_PREFIX
+        if isinstance(encrypted_key, bytes):
+            prefix = prefix.encode()
+
+        if encrypted_key.startswith(prefix):
+            combined = base64.b64decode(encrypted_key[len(prefix):])
+            salt, nonce, encrypted_data = combined[:16], combined[16:28], combined[28:]
+            key = self._derive_key(password, salt)
+            try:
+                vault_key = self._aead(key).decrypt(nonce, encrypted_data, None).decode()
+            except InvalidTag:
+                raise ValueError("Invalid password or corrupted key")
+            logger.info("Vault key decrypted successfully")
+            return vault_key
+
+        # Legacy AES-CBC format: base64 of salt, IV and padded ciphertext
         combined = base64.b64decode(encrypted_key)
 
         # Extract salt, IV, and encrypted data
@@ -177,14 +272,7 @@ class SecureKeyManager:
         encrypted_data = combined[32:]
 
         # Derive key from password
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = kdf.derive(password.encode())
+        key = self._derive_key(password, salt)
 
         # Decrypt
         cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
@@ -200,6 +288,147 @@ class SecureKeyManager:
         logger.info("Vault key decrypted successfully")
         return vault_key
 
+    def encrypt_stream(
+        self,
+        chunks: Iterable[bytes],
+        writer: BinaryIO,
+        password: Optional[str] = None,
+        key_file: Optional[Path] = None,
+    ) -> None:
+        """
+        Encrypt a stream of plaintext chunks with AES-256-GCM.
+
+        Output layout is magic, salt, nonce, ciphertext and finally the GCM tag,
+        so memory use stays bounded by a single chunk regardless of input size.
+
+        Args:
+            chunks: Iterable of plaintext byte chunks
+            writer: Binary file-like object receiving the encrypted stream
+            password: User password for encryption
+            key_file: Key file from export_backup_key, used instead of a password
+        """
+        logger.info("Encrypting data stream with password protection")
+
+        if key_file is not None:
+            salt, key = self.load_backup_key(key_file)
+        else:
+            salt, key = self._encryption_key(password)
+        nonce = secrets.token_bytes(12)
+
+        cipher = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=default_backend())
+        encryptor = cipher.encryptor()
+
+        writer.write(self.STREAM_MAGIC + salt + nonce)
+        for chunk in chunks:
+            writer.write(encryptor.update(chunk))
+        writer.write(encryptor.finalize())
+        writer.write(encryptor.tag)
+
+        logger.info("Data stream encrypted successfully")
+
+    def decrypt_stream(self, reader: BinaryIO, password: str) -> Iterator[bytes]:
+        """
+        Decrypt a stream written by encrypt_stream.
+
+        Plaintext is yielded chunk by chunk. The GCM tag is only verified once
+        the stream is exhausted, at which point tampering raises ValueError.
+
+        Args:
+            reader: Binary file-like object positioned at the stream start
+            password: User password for decryption
+
+        Returns:
+            Iterator over decrypted plaintext chunks
+        """
+        logger.info("Decrypting data stream")
+
+        header = reader.read(len(self.STREAM_MAGIC) + 16 + 12)
+        if len(header) < len(self.STREAM_MAGIC) + 28 or not header.startswith(self.STREAM_MAGIC):
+            raise ValueError("Not a VaultRunner encrypted stream")
+
+        salt = header[len(self.STREAM_MAGIC):-12]
+        nonce = header[-12:]
+        key = self._derive_key(password, salt)
+
+        cipher = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=default_backend())
+        decryptor = cipher.decryptor()
+
+        # Hold back the trailing bytes that may belong to the tag
+        pending = b""
+        while True:
+            chunk = reader.read(self.STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            if len(pending) > self.GCM_TAG_SIZE:
+                yield decryptor.update(pending[:-self.GCM_TAG_SIZE])
+                pending = pending[-self.GCM_TAG_SIZE:]
+
+        if len(pending) != self.GCM_TAG_SIZE:
+            raise ValueError("Encrypted stream is truncated")
+
+        try:
+            tail = decryptor.finalize_with_tag(pending)
+        except InvalidTag:
+            raise ValueError("Invalid password or corrupted data")
+        if tail:
+            yield tail
+
+        logger.info("Data stream decrypted successfully")
+
+    def export_backup_key(self, password: str, key_file: Optional[Path] = None) -> Path:
+        """
+        Write the password-derived backup encryption key to a private file.
+
+        Unattended backups can encrypt with this file instead of the password,
+        so the password never appears in scripts or process arguments and key
+        derivation is skipped. Backups made this way decrypt with the password.
+
+        The key is stored unwrapped: the file is a bearer key protected only by
+        its 0600 permissions, and anyone who can read it can decrypt every
+        backup made with it.
+
+        Args:
+            password: User password the key is derived from
+            key_file: Destination path (default: keys/backup.key)
+
+        Returns:
+            Path of the written key file
+        """
+        key_file = key_file or self.keys_dir / "backup.key"
+        salt = secrets.token_bytes(16)
+        key = self._derive_key(password, salt)
+
+        key_data = {
+            "salt": base64.b64encode(salt).decode(),
+            "key": base64.b64encode(key).decode(),
+            "created_at": datetime.utcnow().isoformat(),
+            "version": "1.0"
+        }
+
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(key_data, f, indent=2)
+        os.chmod(key_file, 0o600)
+
+        logger.info("Backup key stored at: %s", key_file)
+        return key_file
+
+    def load_backup_key(self, key_file: Path) -> Tuple[bytes, bytes]:
+        """
+        Load a backup key written by export_backup_key.
+
+        Args:
+            key_file: Path to the backup key file
+
+        Returns:
+            Tuple of (salt, key)
+        """
+        with open(key_file, "r", encoding="utf-8") as f:
+            key_data = json.load(f)
+
+        return base64.b64decode(key_data["salt"]), base64.b64decode(key_data["key"])
+
     def store_encrypted_key(self, encrypted_key: str, metadata: Dict[str, Any]) -> None:
         """
         Store encrypted key and metadata securely.
@@ -0,0 +1,34 @@
+"""
+Compression Utility Module
+
+Provides streaming compression for backup data.
+Uses zstandard when it is installed and falls back to zlib otherwise.
+"""
+
+import zlib
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def compressor() -> Tuple[str, Any]:
+    """Get the preferred codec name and a streaming compressor for it."""
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=3).compressobj()
+    return "zlib", zlib.compressobj(6)
+
+
+def decompressor(codec: Optional[str]) -> Callable[[bytes], bytes]:
+    """Get a streaming decompress function for a codec (None means uncompressed)."""
+    if codec is None:
+        return lambda data: data
+    if codec == "zlib":
+        return zlib.decompressobj().decompress
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Backup is zstd-compressed; install zstandard to restore it")
+        return zstandard.ZstdDecompressor().decompressobj().decompress
+    raise ValueError(f"Unsupported compression: {codec}")
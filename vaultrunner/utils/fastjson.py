@@ -0,0 +1,36 @@
+"""
+Fast JSON Utility Module
+
+Provides JSON encoding and decoding backed by orjson when it is installed.
+Falls back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,86 @@
+"""
+Lazy Parser Utility Module
+
+Builds argparse subcommand parsers on demand so CLI startup only pays for
+the parsers of the command actually being invoked.
+"""
+
+import sys
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+HELP_FLAGS = ("-h", "--help")
+
+
+def command_invoked(command: str, argv: Optional[Sequence[str]] = None) -> bool:
+    """Check whether a top-level command appears in the arguments (default: sys.argv[1:])."""
+    if argv is None:
+        argv = sys.argv[1:]
+    return command in argv
+
+
+def sniff_subcommand(command: str, argv: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Find the subcommand given after a top-level command.
+
+    Args:
+        command: Top-level command name, e.g. "docker"
+        argv: Arguments to inspect (default: sys.argv[1:])
+
+    Returns:
+        The subcommand name, or None when help was requested or no
+        subcommand was given and every subcommand parser is needed
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    argv = list(argv)
+
+    if command not in argv:
+        return None
+
+    for token in argv[argv.index(command) + 1:]:
+        if token in HELP_FLAGS:
+            return None
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+class LazySubparsers:
+    """Collects subcommand parser builders and only builds the ones needed."""
+
+    def __init__(self, subparsers: Any, command: str, argv: Optional[Sequence[str]] = None):
+        """
+        Initialize lazy subparsers.
+
+        Args:
+            subparsers: Action returned by add_subparsers()
+            command: Top-level command owning the subparsers
+            argv: Arguments to inspect (default: sys.argv[1:])
+        """
+        self._subparsers = subparsers
+        self._invoked = command_invoked(command, argv)
+        self._selected = sniff_subcommand(command, argv)
+        self._builders: Dict[str, Tuple[Optional[Callable[[Any], None]], Dict[str, Any]]] = {}
+
+    def add_parser(
+        self, name: str, builder: Optional[Callable[[Any], None]] = None, **kwargs: Any
+    ) -> None:
+        """Register a subcommand; builder receives the parser to add arguments to."""
+        self._builders[name] = (builder, kwargs)
+
+    def materialize(self) -> None:
+        """Build the invoked subcommand parser, or all of them when it is unknown."""
+        if not self._invoked:
+            return
+
+        if self._selected in self._builders:
+            names = [self._selected]
+        else:
+            # Help, no subcommand or a typo: argparse needs every choice
+            names = list(self._builders)
+
+        for name in names:
+            builder, kwargs = self._builders[name]
+            parser = self._subparsers.add_parser(name, **kwargs)
+            if builder is not None:
+                builder(parser)
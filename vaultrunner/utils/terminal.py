@@ -0,0 +1,27 @@
+"""
+Terminal Utility Module
+
+Detects whether getpass can prompt on a terminal. getpass reads from the
+controlling terminal rather than stdin, so redirected stdin does not matter.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def terminal_available() -> bool:
+    """Check whether getpass can prompt without falling back to echoed stdin."""
+    try:
+        import termios  # noqa: F401
+    except ImportError:
+        # No /dev/tty to probe (e.g. Windows); rely on stdin being a console
+        return sys.stdin is not None and sys.stdin.isatty()
+
+    try:
+        fd = os.open("/dev/tty", os.O_RDWR | os.O_NOCTTY)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
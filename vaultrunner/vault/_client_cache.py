@@ -0,0 +1,46 @@
+"""
+Vault Client Cache
+
+Shares one VaultClient per Vault server, namespace and token within a process,
+so command handlers do not repeat client setup or the vault key password prompt.
+"""
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import VaultClient
+
+_CacheKey = Tuple[Optional[str], Optional[str], str, str]
+
+_INSTANCES: Dict[_CacheKey, "VaultClient"] = {}
+_LOCK = threading.Lock()
+
+
+def _cache_key(config) -> _CacheKey:
+    """Build the cache key for a configuration; the token is only kept as a digest."""
+    token_hash = hashlib.sha256((config.vault_token or "").encode()).hexdigest()
+    return (config.vault_addr, config.vault_namespace, str(config.vault_dir), token_hash)
+
+
+def get_cached_vault_client(config) -> "VaultClient":
+    """Get the shared VaultClient for a configuration, creating it on first use."""
+    key = _cache_key(config)
+    with _LOCK:
+        client = _INSTANCES.get(key)
+        if client is None:
+            # Imported here so command modules can use the cache without loading the client
+            from .client import VaultClient
+
+            client = VaultClient(config)
+            _INSTANCES[key] = client
+            # Creating the client may unlock the token; later lookups see it set
+            _INSTANCES.setdefault(_cache_key(config), client)
+        return client
+
+
+def clear_vault_client_cache() -> None:
+    """Drop all cached clients, e.g. after credentials change."""
+    with _LOCK:
+        _INSTANCES.clear()
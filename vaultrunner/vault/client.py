@@ -6,10 +6,12 @@ Implements security-first Vault operations with automatic key decryption.
 """
 
 import os
+import asyncio
 import subprocess
 import getpass
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from ..utils.logging import get_logger
+from ..utils import fastjson
 from ..security.key_manager import SecureKeyManager
 
 logger = get_logger(__name__)
@@ -18,6 +20,9 @@ logger = get_logger(__name__)
 class VaultClient:
     """Vault client with security-first operations."""
 
+    # Concurrent vault CLI invocations used by the batch helpers
+    BATCH_CONCURRENCY = 32
+
     def __init__(self, config):
         """Initialize Vault client."""
         self.config = config
@@ -63,7 +68,7 @@ class VaultClient:
     def put_secret(self, path: str, value: str) -> bool:
         """Put a secret in Vault."""
         try:
-            cmd = ["vault", "kv", "put", f"secret/{path}", f"value={value}"]
+            cmd = self._put_command(path, value)
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
             return result.returncode == 0
         except (ValueError, RuntimeError, OSError) as e:
@@ -73,7 +78,7 @@ class VaultClient:
     def get_secret(self, path: str) -> Optional[str]:
         """Get a secret from Vault."""
         try:
-            cmd = ["vault", "kv", "get", "-field=value", f"secret/{path}"]
+            cmd = self._get_command(path)
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
             if result.returncode == 0:
                 return result.stdout.strip()
@@ -82,14 +87,77 @@ class VaultClient:
             logger.error("Failed to get secret: %s", e)
             return None
 
+    def batch_put(self, items: Dict[str, str]) -> Dict[str, bool]:
+        """Put multiple secrets in Vault concurrently.
+
+        Returns a mapping of each path to whether its write succeeded.
+        """
+        return asyncio.run(self._put_many_async(items))
+
+    def batch_get(self, paths: List[str]) -> Dict[str, Optional[str]]:
+        """Get multiple secrets from Vault concurrently."""
+        return asyncio.run(self._get_many_async(paths))
+
+    async def put_secret_async(self, path: str, value: str, semaphore: asyncio.Semaphore) -> bool:
+        """Put a secret in Vault from a coroutine, bounded by a shared semaphore."""
+        try:
+            returncode, _ = await self._run_async(self._put_command(path, value), semaphore)
+            return returncode == 0
+        except (ValueError, RuntimeError, OSError) as e:
+            logger.error("Failed to put secret: %s", e)
+            return False
+
+    async def get_secret_async(self, path: str, semaphore: asyncio.Semaphore) -> Optional[str]:
+        """Get a secret from Vault from a coroutine, bounded by a shared semaphore."""
+        try:
+            returncode, stdout = await self._run_async(self._get_command(path), semaphore)
+            return stdout.strip() if returncode == 0 else None
+        except (ValueError, RuntimeError, OSError) as e:
+            logger.error("Failed to get secret: %s", e)
+            return None
+
+    async def _put_many_async(self, items: Dict[str, str]) -> Dict[str, bool]:
+        """Run vault CLI writes concurrently, bounded by BATCH_CONCURRENCY."""
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self.put_secret_async(path, value, semaphore) for path, value in items.items())
+        )
+        return dict(zip(items, results))
+
+    async def _get_many_async(self, paths: List[str]) -> Dict[str, Optional[str]]:
+        """Run vault CLI reads concurrently, bounded by BATCH_CONCURRENCY."""
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self.get_secret_async(path, semaphore) for path in paths)
+        )
+        return dict(zip(paths, results))
+
+    async def _run_async(self, cmd: List[str], semaphore: asyncio.Semaphore) -> Tuple[int, str]:
+        """Run a vault CLI command without blocking the event loop."""
+        async with semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            stdout, _ = await process.communicate()
+        return process.returncode, stdout.decode()
+
+    def _put_command(self, path: str, value: str) -> List[str]:
+        """Build the vault CLI command that writes a secret."""
+        return ["vault", "kv", "put", f"secret/{path}", f"value={value}"]
+
+    def _get_command(self, path: str) -> List[str]:
+        """Build the vault CLI command that reads a secret."""
+        return ["vault", "kv", "get", "-field=value", f"secret/{path}"]
+
     def list_secrets(self, path: Optional[str] = None) -> Optional[List[str]]:
         """List secrets from Vault."""
         try:
             vault_path = "secret/" + (path if path else "")
-            cmd = ["vault", "kv", "list", vault_path]
+            cmd = ["vault", "kv", "list", "-format=json", vault_path]
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
             if result.returncode == 0:
-                return result.stdout.strip().split("\n")[2:]  # Skip header
+                # Folder entries keep Vault's trailing slash
+                return fastjson.loads(result.stdout)
             return None
         except (ValueError, RuntimeError, OSError) as e:
             logger.error("Failed to list secrets: %s", e)